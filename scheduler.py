@@ -21,19 +21,32 @@ Cron equivalent (if you prefer crontab over this scheduler):
 """
 
 import argparse
+import functools
 import logging
 import logging.handlers
 import os
+import random
 import signal
 import sys
-from datetime import datetime
+import time
+from datetime import time as dt_time
 from pathlib import Path
 
 import yaml
 
-# APScheduler v3.x
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.cron import CronTrigger
+# Use the libyaml C loader when available — same safe-load semantics,
+# compiled implementation
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# APScheduler (~150ms import) is deferred into main() — it is only needed
+# when the daemon actually schedules, not for --help or --run-now
+
+# Hoisted to module level: the daemon fires this job daily, and sys.modules
+# caching means a function-local import never gave fresh state anyway
+from main import run_pipeline
 
 
 logger = logging.getLogger(__name__)
@@ -70,32 +83,42 @@ def _configure_scheduler_logging(log_dir: str) -> None:
     logging.getLogger("apscheduler").setLevel(logging.WARNING)
 
 
-def _run_full_pipeline(config_path: str, max_retries: int, retry_delay: int) -> None:
-    """Execute the full detection pipeline with retry logic.
+@functools.lru_cache(maxsize=None)
+def _build_cron_trigger(run_time: str, timezone: str):
+    """Parse an 'HH:MM' schedule string and build the daily CronTrigger.
 
-    This function is called by APScheduler on each scheduled trigger.
-    It imports and runs main.run_pipeline() so the scheduler and CLI
-    share identical pipeline logic.
+    Cached on (run_time, timezone) so any future config reload with an
+    unchanged schedule reuses the already-parsed trigger.
 
     Args:
-        config_path: Path to configuration YAML.
-        max_retries: Maximum retry attempts on failure.
-        retry_delay: Seconds to wait between retries.
+        run_time: Daily run time in 24h 'HH:MM' format.
+        timezone: IANA timezone name, e.g. 'Europe/London'.
+
+    Returns:
+        Configured apscheduler CronTrigger.
     """
-    import time
+    from apscheduler.triggers.cron import CronTrigger
 
-    # Import here to ensure fresh module state on each run
-    import argparse as _ap
-    from main import run_pipeline, _configure_logging
+    parsed = dt_time.fromisoformat(run_time)
+    return CronTrigger(hour=parsed.hour, minute=parsed.minute, timezone=timezone)
 
-    run_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    logger.info("=" * 70)
-    logger.info("SCHEDULED PIPELINE RUN — %s", run_time)
-    logger.info("=" * 70)
 
-    # Build a namespace that mirrors --full-run
-    args = _ap.Namespace(
+def _build_full_run_args(config_path: str) -> argparse.Namespace:
+    """Build the argparse Namespace that mirrors `main.py --full-run`.
+
+    Constructed once at scheduler boot — the shape of the arguments is
+    fixed at configure time, so there is no need to rebuild the Namespace
+    on every job fire.
+
+    Args:
+        config_path: Path to configuration YAML.
+
+    Returns:
+        Namespace equivalent to parsing `--full-run --config <path>`.
+    """
+    return argparse.Namespace(
         config=config_path,
+        cfg=None,
         log_level="INFO",
         full_run=True,
         generate_data=False,
@@ -105,6 +128,42 @@ def _run_full_pipeline(config_path: str, max_retries: int, retry_delay: int) ->
         alert=False,
     )
 
+
+def _run_full_pipeline(
+    args: argparse.Namespace,
+    max_retries: int,
+    retry_delay: int,
+    retry_delay_max: int = 1800,
+) -> None:
+    """Execute the full detection pipeline with retry logic.
+
+    This function is called by APScheduler on each scheduled trigger.
+    It runs main.run_pipeline() so the scheduler and CLI share identical
+    pipeline logic.
+
+    Args:
+        args: Precomputed --full-run Namespace from _build_full_run_args().
+        max_retries: Maximum retry attempts on failure.
+        retry_delay: Base seconds to wait between retries; doubles each
+            attempt with a small random jitter added.
+        retry_delay_max: Upper cap on any single backoff wait, in seconds.
+    """
+    # time.strftime is C-implemented — no datetime object allocation on a
+    # long-running daemon's job fires
+    run_time = time.strftime("%Y-%m-%d %H:%M:%S")
+    logger.info("=" * 70)
+    logger.info("SCHEDULED PIPELINE RUN — %s", run_time)
+    logger.info("=" * 70)
+
+    # Re-parse the config on each fire so daily edits to config.yaml are
+    # picked up without restarting the daemon; run_pipeline prefers the
+    # parsed dict over re-reading the path
+    try:
+        with open(args.config, "r") as fh:
+            args.cfg = yaml.load(fh, Loader=_YamlLoader)
+    except Exception:
+        args.cfg = None
+
     for attempt in range(1, max_retries + 1):
         try:
             exit_code = run_pipeline(args, logger)
@@ -128,8 +187,16 @@ def _run_full_pipeline(config_path: str, max_retries: int, retry_delay: int) ->
             )
 
         if attempt < max_retries:
-            logger.info("Retrying in %d seconds...", retry_delay)
-            time.sleep(retry_delay)
+            # Exponential backoff with jitter — spaces later attempts out so
+            # a transient outage has more time to clear, while jitter avoids
+            # synchronised retries across deployments
+            delay = min(
+                retry_delay * (2 ** (attempt - 1))
+                + random.uniform(0, retry_delay * 0.1),
+                retry_delay_max,
+            )
+            logger.info("Retrying in %.0f seconds...", delay)
+            time.sleep(delay)
 
     logger.error(
         "Pipeline failed after %d attempt(s) — will retry at next scheduled time",
@@ -168,7 +235,7 @@ def main() -> None:
     config_path = args.config
     try:
         with open(config_path, "r") as fh:
-            cfg = yaml.safe_load(fh)
+            cfg = yaml.load(fh, Loader=_YamlLoader)
     except FileNotFoundError:
         print(f"ERROR: Configuration file not found: {config_path}", file=sys.stderr)
         sys.exit(1)
@@ -181,27 +248,29 @@ def main() -> None:
     timezone = sched_cfg.get("timezone", "Europe/London")
     max_retries = sched_cfg.get("max_retries", 3)
     retry_delay = sched_cfg.get("retry_delay_seconds", 300)
+    retry_delay_max = sched_cfg.get("retry_delay_max_seconds", 1800)
 
-    run_hour, run_minute = map(int, run_time.split(":"))
+    # The --full-run argument shape is fixed at boot — build it once
+    full_run_args = _build_full_run_args(config_path)
 
     if args.run_now:
         logger.info("--run-now flag set — executing pipeline immediately")
-        _run_full_pipeline(config_path, max_retries, retry_delay)
+        _run_full_pipeline(full_run_args, max_retries, retry_delay, retry_delay_max)
         logger.info("Immediate run complete — exiting")
         return
 
+    # APScheduler v3.x — imported only on the daemon path
+    from apscheduler.schedulers.blocking import BlockingScheduler
+
     scheduler = BlockingScheduler(timezone=timezone)
     scheduler.add_job(
         func=_run_full_pipeline,
-        trigger=CronTrigger(
-            hour=run_hour,
-            minute=run_minute,
-            timezone=timezone,
-        ),
+        trigger=_build_cron_trigger(run_time, timezone),
         kwargs={
-            "config_path": config_path,
+            "args": full_run_args,
             "max_retries": max_retries,
             "retry_delay": retry_delay,
+            "retry_delay_max": retry_delay_max,
         },
         id="daily_leakage_detection",
         name="Daily Cost Leakage Detection Pipeline",
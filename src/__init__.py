@@ -8,4 +8,27 @@ Modules:
     reporter        — Excel report + summary statistics
     dashboard       — Interactive Plotly HTML dashboard
     alerter         — Slack webhook alerting for Critical findings
+
+Submodules are imported lazily via module-level __getattr__ (PEP 562) so
+that `from src import detector` does not pull in the heavy dependencies
+of unrelated stages (plotly, openpyxl, requests) at package import time.
 """
+
+import importlib
+
+_SUBMODULES = {
+    "config",
+    "data_generator",
+    "detector",
+    "scorer",
+    "reporter",
+    "dashboard",
+    "alerter",
+}
+
+
+def __getattr__(name: str):
+    """Lazily import submodules on first attribute access."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
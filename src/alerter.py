@@ -26,6 +26,8 @@ from typing import Any
 import requests
 import yaml
 
+from src.config import resolve_config
+
 logger = logging.getLogger(__name__)
 
 _SLACK_COLOUR_MAP = {
@@ -235,7 +237,7 @@ def _post_with_retry(
 def send_alert(
     scored_df,
     summary: dict[str, Any],
-    config_path: str = "config.yaml",
+    config_path: str | dict[str, Any] = "config.yaml",
 ) -> bool:
     """Send a Slack alert if Critical-severity findings are present.
 
@@ -246,13 +248,13 @@ def send_alert(
     Args:
         scored_df: Scored DataFrame from scorer.score_flagged_transactions().
         summary: Executive summary dict.
-        config_path: Path to configuration YAML.
+        config_path: Path to configuration YAML, or an already-parsed
+            config dict.
 
     Returns:
         True if alert was sent (or dry-run logged), False if delivery failed.
     """
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
+    cfg = resolve_config(config_path)
 
     threshold = cfg["alerting"]["alert_severity_threshold"]
     critical_count = summary["severity_breakdown"].get(threshold, 0)
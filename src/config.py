@@ -0,0 +1,68 @@
+"""
+config.py — Shared configuration resolution.
+
+Stage functions historically took a path to config.yaml and re-parsed it on
+every call — six to eight redundant YAML parses per pipeline run. They now
+accept either a path or an already-parsed dict; resolve_config() normalises
+the two so a single parse in main() can be threaded through every stage.
+"""
+
+import functools
+import logging
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# Prefer the libyaml C loader when PyYAML was built against it (~10× faster
+# tokenization); fall back to the pure-Python safe loader otherwise.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_file(resolved_path: str) -> dict[str, Any]:
+    """Parse a YAML config file, memoized on its resolved absolute path.
+
+    Repeated path-based calls (e.g. a test suite invoking stage functions
+    directly) hit the cache instead of re-reading and re-tokenizing the
+    file. Callers must treat the returned dict as read-only — it is shared
+    across every caller of the same path.
+
+    Args:
+        resolved_path: Absolute path to the YAML file.
+
+    Returns:
+        Parsed configuration dictionary.
+    """
+    with open(resolved_path, "r") as fh:
+        parsed = yaml.load(fh, Loader=_YamlLoader)
+    logger.debug("Configuration parsed from %s", resolved_path)
+    return parsed
+
+
+def resolve_config(config: dict[str, Any] | str | Path) -> dict[str, Any]:
+    """Return the parsed configuration dict, parsing YAML only when needed.
+
+    Args:
+        config: Either an already-parsed configuration dict (returned
+            unchanged — no re-parse) or a path to a YAML file.
+
+    Returns:
+        Parsed configuration dictionary.
+
+    Raises:
+        FileNotFoundError: If given a path that does not exist.
+        yaml.YAMLError: If the YAML file is malformed.
+    """
+    if isinstance(config, dict):
+        return config
+
+    config_path = Path(config)
+    if not config_path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    return _load_config_file(str(config_path.resolve()))
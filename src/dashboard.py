@@ -16,11 +16,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import yaml
 
+from src.config import resolve_config
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -49,27 +53,98 @@ RULE_LABELS = {
 
 DASHBOARD_TEMPLATE = "plotly_white"
 
+# ---------------------------------------------------------------------------
+# Static layout fragments — built once at import rather than per chart call;
+# the builders only fill in the handful of dynamic fields (e.g. top_n)
+# ---------------------------------------------------------------------------
+_TITLE_FONT = {"size": 16, "color": "#1F4E79"}
+
+_LAYOUT_CATEGORY = {
+    "title": {
+        "text": "Estimated Leakage by Procurement Category",
+        "font": _TITLE_FONT,
+    },
+    "barmode": "stack",
+    "xaxis_title": "Estimated Leakage (£)",
+    "yaxis_title": "Category",
+    "template": DASHBOARD_TEMPLATE,
+    "legend": {"title": "Detection Rule"},
+    "height": 380,
+    "margin": {"l": 160, "r": 30, "t": 60, "b": 40},
+    "xaxis": {"tickformat": "£,.0f"},
+}
+
+_LAYOUT_TREND = {
+    "title": {
+        "text": "Daily Leakage Trend with Critical Flag Count",
+        "font": _TITLE_FONT,
+    },
+    "template": DASHBOARD_TEMPLATE,
+    "legend": {"orientation": "h", "yanchor": "bottom", "y": 1.02, "xanchor": "right", "x": 1},
+    "height": 380,
+    "margin": {"l": 60, "r": 60, "t": 80, "b": 40},
+}
+
+_LAYOUT_HEATMAP = {
+    "title": {
+        "text": "Severity Heatmap: Rule × Severity Flag Density",
+        "font": _TITLE_FONT,
+    },
+    "xaxis_title": "Severity",
+    "yaxis_title": "Detection Rule",
+    "template": DASHBOARD_TEMPLATE,
+    "height": 360,
+    "margin": {"l": 200, "r": 30, "t": 60, "b": 40},
+}
+
+_LAYOUT_SUPPLIERS = {
+    "barmode": "stack",
+    "xaxis_title": "Estimated Leakage (£)",
+    "yaxis_title": "Supplier",
+    "template": DASHBOARD_TEMPLATE,
+    "legend": {"title": "Detection Rule"},
+    "height": 400,
+    "margin": {"l": 200, "r": 30, "t": 60, "b": 40},
+    "xaxis": {"tickformat": "£,.0f"},
+}
 
-def _chart_leakage_by_category(scored: pd.DataFrame) -> go.Figure:
+# Per-rule hovertemplates prebuilt once — the only varying piece is the label
+_RULE_HOVER = {
+    rule: (
+        "<b>%{y}</b><br>"
+        f"Rule: {label}<br>"
+        "Leakage: £%{x:,.2f}<extra></extra>"
+    )
+    for rule, label in RULE_LABELS.items()
+}
+
+# KPI tile markup — compiled once at import; filled per tile via .format
+_KPI_TILE_TPL = """
+        <div style="
+            background:{colour}; color:white; border-radius:8px;
+            padding:12px 18px; min-width:120px; text-align:center;
+            box-shadow: 2px 2px 6px rgba(0,0,0,0.2);
+        ">
+            <div style="font-size:11px; font-weight:600; letter-spacing:1px; opacity:0.85;">{label}</div>
+            <div style="font-size:22px; font-weight:700; margin-top:4px;">{value}</div>
+        </div>"""
+
+
+def _chart_leakage_by_category(category_rule: pd.DataFrame) -> go.Figure:
     """Build a horizontal bar chart: estimated leakage by procurement category.
 
     Each bar is split by rule type (stacked) so analysts can see which rules
     dominate within each spend category.
 
     Args:
-        scored: Scored flagged transactions.
+        category_rule: Pre-aggregated (category, rule_triggered) leakage sums
+            from generate_dashboard().
 
     Returns:
         Plotly Figure object.
     """
-    category_rule = (
-        scored.groupby(["category", "rule_triggered"])["leakage_amount_gbp"]
-        .sum()
-        .reset_index()
-    )
-
     fig = go.Figure()
-    for rule in scored["rule_triggered"].unique():
+    for rule in category_rule["rule_triggered"].unique():
         mask = category_rule["rule_triggered"] == rule
         subset = category_rule[mask].sort_values("leakage_amount_gbp")
         fig.add_trace(
@@ -79,59 +154,31 @@ def _chart_leakage_by_category(scored: pd.DataFrame) -> go.Figure:
                 name=RULE_LABELS.get(rule, rule),
                 orientation="h",
                 marker_color=RULE_COLOURS.get(rule, "#888888"),
-                hovertemplate=(
-                    "<b>%{y}</b><br>"
-                    f"Rule: {RULE_LABELS.get(rule, rule)}<br>"
-                    "Leakage: £%{x:,.2f}<extra></extra>"
+                hovertemplate=_RULE_HOVER.get(
+                    rule,
+                    f"<b>%{{y}}</b><br>Rule: {rule}<br>"
+                    "Leakage: £%{x:,.2f}<extra></extra>",
                 ),
             )
         )
 
-    fig.update_layout(
-        title={
-            "text": "Estimated Leakage by Procurement Category",
-            "font": {"size": 16, "color": "#1F4E79"},
-        },
-        barmode="stack",
-        xaxis_title="Estimated Leakage (£)",
-        yaxis_title="Category",
-        template=DASHBOARD_TEMPLATE,
-        legend={"title": "Detection Rule"},
-        height=380,
-        margin={"l": 160, "r": 30, "t": 60, "b": 40},
-        xaxis={"tickformat": "£,.0f"},
-    )
+    fig.update_layout(**_LAYOUT_CATEGORY)
     return fig
 
 
-def _chart_daily_trend(scored: pd.DataFrame) -> go.Figure:
+def _chart_daily_trend(daily: pd.DataFrame) -> go.Figure:
     """Build a daily leakage area chart with Critical flag count as a bar overlay.
 
     Uses a secondary Y-axis for the Critical count so both series are
     readable at different scales.
 
     Args:
-        scored: Scored flagged transactions.
+        daily: Pre-aggregated per-day frame from generate_dashboard() with
+            columns Date, leakage_gbp, critical_count, flag_count.
 
     Returns:
         Plotly Figure with secondary y-axis.
     """
-    scored_copy = scored.copy()
-    if not pd.api.types.is_datetime64_any_dtype(scored_copy["date"]):
-        scored_copy["date"] = pd.to_datetime(scored_copy["date"])
-
-    daily = (
-        scored_copy.groupby(scored_copy["date"].dt.date)
-        .agg(
-            leakage_gbp=("leakage_amount_gbp", "sum"),
-            critical_count=("severity", lambda s: (s == "Critical").sum()),
-            flag_count=("transaction_id", "count"),
-        )
-        .reset_index()
-        .rename(columns={"date": "Date"})
-        .sort_values("Date")
-    )
-
     fig = make_subplots(specs=[[{"secondary_y": True}]])
 
     # Area: total daily leakage
@@ -162,45 +209,28 @@ def _chart_daily_trend(scored: pd.DataFrame) -> go.Figure:
         secondary_y=True,
     )
 
-    fig.update_layout(
-        title={
-            "text": "Daily Leakage Trend with Critical Flag Count",
-            "font": {"size": 16, "color": "#1F4E79"},
-        },
-        template=DASHBOARD_TEMPLATE,
-        legend={"orientation": "h", "yanchor": "bottom", "y": 1.02, "xanchor": "right", "x": 1},
-        height=380,
-        margin={"l": 60, "r": 60, "t": 80, "b": 40},
-    )
+    fig.update_layout(**_LAYOUT_TREND)
     fig.update_yaxes(title_text="Estimated Leakage (£)", tickformat="£,.0f", secondary_y=False)
     fig.update_yaxes(title_text="Critical Flag Count", secondary_y=True)
     return fig
 
 
-def _chart_severity_heatmap(scored: pd.DataFrame) -> go.Figure:
+def _chart_severity_heatmap(rule_severity: pd.DataFrame) -> go.Figure:
     """Build a Rule × Severity heatmap showing flag count density.
 
     Provides an at-a-glance view of which rules generate the highest severity
     findings — essential for prioritisation.
 
     Args:
-        scored: Scored flagged transactions.
+        rule_severity: Pre-aggregated rule × severity flag-count matrix from
+            generate_dashboard(), with severity columns already in order.
 
     Returns:
         Plotly Figure heatmap.
     """
-    pivot = (
-        scored.groupby(["rule_triggered", "severity"])
-        .size()
-        .unstack(fill_value=0)
-    )
-
-    # Ensure all severity columns present and in order
-    for sev in ["Low", "Medium", "High", "Critical"]:
-        if sev not in pivot.columns:
-            pivot[sev] = 0
-    pivot = pivot[["Low", "Medium", "High", "Critical"]]
-    pivot.index = [RULE_LABELS.get(r, r) for r in pivot.index]
+    z = rule_severity.to_numpy()
+    sev_labels = list(rule_severity.columns)
+    rule_labels = [RULE_LABELS.get(r, r) for r in rule_severity.index]
 
     # Custom colour scale: green→red
     colorscale = [
@@ -211,18 +241,18 @@ def _chart_severity_heatmap(scored: pd.DataFrame) -> go.Figure:
     ]
 
     hover_text = [
-        [f"{rule}<br>Severity: {sev}<br>Flags: {pivot.at[rule, sev]}"
-         for sev in pivot.columns]
-        for rule in pivot.index
+        [f"{rule}<br>Severity: {sev}<br>Flags: {z[i, j]}"
+         for j, sev in enumerate(sev_labels)]
+        for i, rule in enumerate(rule_labels)
     ]
 
     fig = go.Figure(
         go.Heatmap(
-            z=pivot.values,
-            x=list(pivot.columns),
-            y=list(pivot.index),
+            z=z,
+            x=sev_labels,
+            y=rule_labels,
             colorscale=colorscale,
-            text=pivot.values,
+            text=z,
             texttemplate="%{text}",
             textfont={"size": 14, "color": "#1F4E79"},
             hovertext=hover_text,
@@ -231,75 +261,44 @@ def _chart_severity_heatmap(scored: pd.DataFrame) -> go.Figure:
             colorbar={"title": "Flags"},
         )
     )
-    fig.update_layout(
-        title={
-            "text": "Severity Heatmap: Rule × Severity Flag Density",
-            "font": {"size": 16, "color": "#1F4E79"},
-        },
-        xaxis_title="Severity",
-        yaxis_title="Detection Rule",
-        template=DASHBOARD_TEMPLATE,
-        height=360,
-        margin={"l": 200, "r": 30, "t": 60, "b": 40},
-    )
+    fig.update_layout(**_LAYOUT_HEATMAP)
     return fig
 
 
-def _chart_top_supplier_exposure(scored: pd.DataFrame, top_n: int = 8) -> go.Figure:
+def _chart_top_supplier_exposure(supplier_rule: pd.DataFrame, top_n: int = 8) -> go.Figure:
     """Build a stacked bar chart of leakage exposure for the top N suppliers.
 
     Breaks down each supplier's leakage by detection rule, enabling the
     procurement team to identify high-risk vendor relationships.
 
     Args:
-        scored: Scored flagged transactions.
+        supplier_rule: Pre-aggregated supplier × rule leakage matrix from
+            generate_dashboard() (suppliers as index, rules as columns).
+
         top_n: Number of suppliers to display (by total leakage).
 
     Returns:
         Plotly Figure object.
     """
-    top_suppliers = (
-        scored.groupby("supplier_name")["leakage_amount_gbp"]
-        .sum()
-        .nlargest(top_n)
-        .index.tolist()
-    )
-    subset = scored[scored["supplier_name"].isin(top_suppliers)]
-
-    supplier_rule = (
-        subset.groupby(["supplier_name", "rule_triggered"])["leakage_amount_gbp"]
-        .sum()
-        .reset_index()
-    )
-
-    # Sort suppliers by total leakage for clean ordering
-    order = (
-        supplier_rule.groupby("supplier_name")["leakage_amount_gbp"]
-        .sum()
-        .sort_values(ascending=True)
-        .index.tolist()
-    )
+    # Totals, top-N selection and ordering all derive from one matrix —
+    # no per-rule filtering, reindexing or re-aggregation needed
+    totals = supplier_rule.sum(axis=1)
+    order = totals.nlargest(top_n).sort_values(ascending=True).index
+    matrix = supplier_rule.loc[order]
 
     fig = go.Figure()
-    for rule in supplier_rule["rule_triggered"].unique():
-        mask = supplier_rule["rule_triggered"] == rule
-        rule_data = (
-            supplier_rule[mask]
-            .set_index("supplier_name")
-            .reindex(order)
-            .fillna(0)
-        )
+    for rule in matrix.columns:
         fig.add_trace(
             go.Bar(
-                y=order,
-                x=rule_data["leakage_amount_gbp"],
+                y=list(order),
+                x=matrix[rule],
                 name=RULE_LABELS.get(rule, rule),
                 orientation="h",
                 marker_color=RULE_COLOURS.get(rule, "#888888"),
-                hovertemplate=(
-                    "<b>%{y}</b><br>"
-                    f"Rule: {RULE_LABELS.get(rule, rule)}<br>"
-                    "Leakage: £%{x:,.2f}<extra></extra>"
+                hovertemplate=_RULE_HOVER.get(
+                    rule,
+                    f"<b>%{{y}}</b><br>Rule: {rule}<br>"
+                    "Leakage: £%{x:,.2f}<extra></extra>",
                 ),
             )
         )
@@ -307,16 +306,9 @@ def _chart_top_supplier_exposure(scored: pd.DataFrame, top_n: int = 8) -> go.Fig
     fig.update_layout(
         title={
             "text": f"Top {top_n} Suppliers by Leakage Exposure",
-            "font": {"size": 16, "color": "#1F4E79"},
+            "font": _TITLE_FONT,
         },
-        barmode="stack",
-        xaxis_title="Estimated Leakage (£)",
-        yaxis_title="Supplier",
-        template=DASHBOARD_TEMPLATE,
-        legend={"title": "Detection Rule"},
-        height=400,
-        margin={"l": 200, "r": 30, "t": 60, "b": 40},
-        xaxis={"tickformat": "£,.0f"},
+        **_LAYOUT_SUPPLIERS,
     )
     return fig
 
@@ -340,17 +332,12 @@ def _build_kpi_header(summary: dict[str, Any]) -> str:
         ("Medium",             str(sev.get("Medium", 0)),                        "#BF8F00"),
         ("Low",                str(sev.get("Low", 0)),                           "#375623"),
     ]
-    tile_html = ""
-    for label, value, colour in tiles:
-        tile_html += f"""
-        <div style="
-            background:{colour}; color:white; border-radius:8px;
-            padding:12px 18px; min-width:120px; text-align:center;
-            box-shadow: 2px 2px 6px rgba(0,0,0,0.2);
-        ">
-            <div style="font-size:11px; font-weight:600; letter-spacing:1px; opacity:0.85;">{label.upper()}</div>
-            <div style="font-size:22px; font-weight:700; margin-top:4px;">{value}</div>
-        </div>"""
+    # List + join instead of repeated += — no quadratic reallocation as the
+    # tile row grows
+    tile_html = "".join(
+        _KPI_TILE_TPL.format(colour=colour, label=label.upper(), value=value)
+        for label, value, colour in tiles
+    )
 
     date_range = f"{summary['date_range']['start']} → {summary['date_range']['end']}"
     return f"""
@@ -371,7 +358,7 @@ def _build_kpi_header(summary: dict[str, Any]) -> str:
 def generate_dashboard(
     scored: pd.DataFrame,
     summary: dict[str, Any],
-    config_path: str = "config.yaml",
+    config_path: str | dict[str, Any] = "config.yaml",
 ) -> Path:
     """Assemble the full interactive dashboard and write to HTML.
 
@@ -381,13 +368,13 @@ def generate_dashboard(
     Args:
         scored: Scored flagged transactions DataFrame.
         summary: Executive summary dict.
-        config_path: Path to configuration YAML.
+        config_path: Path to configuration YAML, or an already-parsed
+            config dict.
 
     Returns:
         Path to the generated .html file.
     """
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
+    cfg = resolve_config(config_path)
 
     run_date = datetime.today().strftime("%Y-%m-%d")
     output_dir = Path(cfg["paths"]["output_dir"])
@@ -397,28 +384,100 @@ def generate_dashboard(
 
     logger.info("Building interactive dashboard — %d records to visualise", len(scored))
 
-    fig_category    = _chart_leakage_by_category(scored)
-    fig_trend       = _chart_daily_trend(scored)
-    fig_heatmap     = _chart_severity_heatmap(scored)
-    fig_suppliers   = _chart_top_supplier_exposure(scored)
+    # Categorical keys: the groupbys below hash small integer codes instead
+    # of Python strings, and the columns shrink to code arrays. The scorer
+    # already emits severity as Categorical, so this usually only converts
+    # the three object-dtype key columns
+    for col in ("rule_triggered", "severity", "supplier_name", "category"):
+        if scored[col].dtype == object:
+            scored[col] = scored[col].astype("category")
+
+    # Single-pass precompute: every chart works from one of these aggregates,
+    # so the raw frame is hashed/grouped once per key set rather than once
+    # per chart builder
+    if pd.api.types.is_datetime64_any_dtype(scored["date"]):
+        dates = scored["date"]
+    else:
+        dates = pd.to_datetime(scored["date"], format="ISO8601")
 
-    # Convert charts to HTML div snippets (no full HTML, just the div)
-    chart_args = {"include_plotlyjs": False, "full_html": False}
-    div_category    = fig_category.to_html(**chart_args)
-    div_trend       = fig_trend.to_html(**chart_args)
-    div_heatmap     = fig_heatmap.to_html(**chart_args)
-    div_suppliers   = fig_suppliers.to_html(**chart_args)
+    category_rule = (
+        scored.groupby(["category", "rule_triggered"], observed=True)[
+            "leakage_amount_gbp"
+        ]
+        .sum()
+        .reset_index()
+    )
+    # Indicator column instead of a per-group Python lambda — all three
+    # aggregations dispatch to the native sum/count kernels. The groupby
+    # works on a three-column view-backed frame rather than a copy of the
+    # whole scored frame; sort=True makes the output date-ordered already
+    daily = (
+        pd.DataFrame(
+            {
+                "Date": dates.dt.date,
+                "leakage_gbp": scored["leakage_amount_gbp"],
+                "is_critical": (scored["severity"] == "Critical").astype(np.int8),
+                "tid": scored["transaction_id"],
+            }
+        )
+        .groupby("Date", sort=True)
+        .agg(
+            leakage_gbp=("leakage_gbp", "sum"),
+            critical_count=("is_critical", "sum"),
+            flag_count=("tid", "count"),
+        )
+        .reset_index()
+    )
+    # 4 rules × 4 severities — a hash-based groupby is pure overhead at
+    # this cardinality. Encode both keys as category codes and accumulate
+    # the count matrix with a single bincount pass
+    rule_cat = pd.Categorical(scored["rule_triggered"])
+    sev_cat = pd.Categorical(
+        scored["severity"], categories=["Low", "Medium", "High", "Critical"]
+    )
+    flat = rule_cat.codes.astype(np.int64) * 4 + sev_cat.codes.astype(np.int64)
+    counts = np.bincount(
+        flat[flat >= 0], minlength=len(rule_cat.categories) * 4
+    ).reshape(-1, 4)
+    rule_severity = pd.DataFrame(
+        counts,
+        index=rule_cat.categories,
+        columns=["Low", "Medium", "High", "Critical"],
+    )
+    supplier_rule = (
+        scored.groupby(["supplier_name", "rule_triggered"], observed=True)[
+            "leakage_amount_gbp"
+        ]
+        .sum()
+        .unstack(fill_value=0)
+    )
 
+    fig_category    = _chart_leakage_by_category(category_rule)
+    fig_trend       = _chart_daily_trend(daily)
+    fig_heatmap     = _chart_severity_heatmap(rule_severity)
+    fig_suppliers   = _chart_top_supplier_exposure(supplier_rule)
+
+    # Serialize each figure to bare JSON and render all four with one
+    # Plotly.newPlot call each — avoids to_html's per-figure wrapper
+    # boilerplate and schema re-validation (figures are built internally)
+    figures = {
+        "chart_category":  fig_category,
+        "chart_trend":     fig_trend,
+        "chart_heatmap":   fig_heatmap,
+        "chart_suppliers": fig_suppliers,
+    }
     kpi_header = _build_kpi_header(summary)
 
-    # Assemble final HTML
-    html = f"""<!DOCTYPE html>
+    # Stream the document to disk in sections — the multi-MB figure JSON
+    # payloads are written one at a time, never joined into a single
+    # in-memory HTML string
+    head = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Cost Leakage Detector — {run_date}</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+    <script src="https://cdn.plot.ly/plotly-cartesian-latest.min.js"></script>
     <style>
         * {{ box-sizing: border-box; margin: 0; padding: 0; }}
         body {{ font-family: 'Segoe UI', Arial, sans-serif; background: #F5F5F5; }}
@@ -452,11 +511,15 @@ def generate_dashboard(
 <body>
     {kpi_header}
     <div class="charts-grid">
-        <div class="chart-card">{div_category}</div>
-        <div class="chart-card">{div_trend}</div>
-        <div class="chart-card">{div_heatmap}</div>
-        <div class="chart-card">{div_suppliers}</div>
+        <div class="chart-card"><div id="chart_category"></div></div>
+        <div class="chart-card"><div id="chart_trend"></div></div>
+        <div class="chart-card"><div id="chart_heatmap"></div></div>
+        <div class="chart-card"><div id="chart_suppliers"></div></div>
     </div>
+    <script>
+"""
+
+    footer = f"""    </script>
     <div class="footer">
         Operations Cost Leakage Detector v1.0 &nbsp;|&nbsp;
         Generated {datetime.today().strftime('%Y-%m-%d %H:%M')} &nbsp;|&nbsp;
@@ -465,6 +528,16 @@ def generate_dashboard(
 </body>
 </html>"""
 
-    output_path.write_text(html, encoding="utf-8")
+    with output_path.open("w", encoding="utf-8", buffering=1024 * 1024) as fh:
+        fh.write(head)
+        for div_id, fig in figures.items():
+            fh.write(f"        var spec_{div_id} = ")
+            fh.write(pio.to_json(fig, validate=False))
+            fh.write(
+                f';\n        Plotly.newPlot("{div_id}", spec_{div_id}.data, '
+                f"spec_{div_id}.layout, {{responsive: true}});\n"
+            )
+        fh.write(footer)
+
     logger.info("Dashboard saved to %s", output_path)
     return output_path
@@ -11,7 +11,6 @@ Outputs:
 
 import logging
 import os
-import random
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -20,8 +19,39 @@ import numpy as np
 import pandas as pd
 import yaml
 
+from src.config import resolve_config
+
+# Arrow's multi-threaded CSV writer beats the pandas one by a wide margin
+# on large frames; fall back silently when pyarrow is not installed
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    _HAVE_PYARROW = True
+except ImportError:
+    _HAVE_PYARROW = False
+
 logger = logging.getLogger(__name__)
 
+# Anomaly-type bit flags — injectors OR these into a uint8 mask column;
+# the pipe-joined anomaly_type string is materialized once at CSV-write
+# time from a 16-entry lookup instead of per-row string concatenation
+ANOMALY_DUPLICATE = np.uint8(1)
+ANOMALY_PRICE = np.uint8(2)
+ANOMALY_SLA = np.uint8(4)
+ANOMALY_SPIKE = np.uint8(8)
+
+_ANOMALY_BIT_NAMES = (
+    (ANOMALY_DUPLICATE, "duplicate"),
+    (ANOMALY_PRICE, "price_variance"),
+    (ANOMALY_SLA, "sla_breach"),
+    (ANOMALY_SPIKE, "volume_spike"),
+)
+_ANOMALY_TYPE_LABELS = [
+    "|".join(name for bit, name in _ANOMALY_BIT_NAMES if code & bit)
+    for code in range(16)
+]
+
 
 def load_config(config_path: str = "config.yaml") -> dict[str, Any]:
     """Load YAML configuration file.
@@ -39,22 +69,47 @@ def load_config(config_path: str = "config.yaml") -> dict[str, Any]:
     config_path = Path(config_path)
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    with open(config_path, "r") as fh:
-        config = yaml.safe_load(fh)
+    config = resolve_config(config_path)
     logger.debug("Configuration loaded from %s", config_path)
     return config
 
 
-def _build_transaction_id(index: int) -> str:
-    """Generate a zero-padded transaction reference.
+def _supplier_lookup(
+    suppliers: list[dict[str, Any]],
+    sla_map: dict[str, int],
+) -> np.ndarray:
+    """Pack supplier attributes into a structured array for integer gathers.
+
+    Built once per generation pass; every per-row supplier attribute
+    (id, name, category, baseline rate, SLA days) then becomes a single
+    `table[field][sup_idx]` fancy index with no dict lookups.
 
     Args:
-        index: Sequential transaction index.
+        suppliers: Supplier dicts from config.yaml.
+        sla_map: Category → SLA-days mapping from config.yaml.
 
     Returns:
-        Formatted transaction ID string, e.g. 'TXN-000042'.
+        Structured array with fields id, name, category, baseline, sla.
     """
-    return f"TXN-{index:06d}"
+    return np.array(
+        [
+            (
+                s["id"],
+                s["name"],
+                s["category"],
+                s["baseline_rate"],
+                sla_map.get(s["category"], 3),
+            )
+            for s in suppliers
+        ],
+        dtype=[
+            ("id", "U16"),
+            ("name", "U64"),
+            ("category", "U32"),
+            ("baseline", "f8"),
+            ("sla", "i8"),
+        ],
+    )
 
 
 def _generate_base_transactions(
@@ -83,269 +138,283 @@ def _generate_base_transactions(
     std_txn = gen_cfg["transactions_per_day_std"]
     suppliers = gen_cfg["suppliers"]
     sla_map = gen_cfg["sla_days_map"]
-    seed = gen_cfg["seed"]
 
-    random.seed(seed)
     start_date = datetime.today() - timedelta(days=days)
+    start_day = np.datetime64(start_date.date())
 
-    regions = ["London", "Manchester", "Birmingham", "Leeds", "Bristol", "Edinburgh"]
-    approvers = ["J.Harrison", "S.Patel", "M.Okonkwo", "L.Chen", "R.Fitzgerald"]
-    po_counter = 10000
-
-    records = []
-    txn_index = 1
-
-    for day_offset in range(days):
-        current_date = start_date + timedelta(days=day_offset)
-        # Weekday weighting — fewer transactions on weekends
-        if current_date.weekday() >= 5:
-            day_mean = max(5, mean_txn * 0.3)
-        else:
-            day_mean = mean_txn
-
-        n_transactions = max(1, int(rng.normal(day_mean, std_txn)))
-
-        for _ in range(n_transactions):
-            supplier = random.choice(suppliers)
-            sla_days = sla_map.get(supplier["category"], 3)
-            # Invoice amount: ±8% natural price variation around baseline
-            invoice_amount = round(
-                float(rng.normal(supplier["baseline_rate"], supplier["baseline_rate"] * 0.08)),
-                2,
-            )
-            invoice_amount = max(10.0, invoice_amount)  # floor at £10
-
-            expected_delivery = current_date + timedelta(days=sla_days)
-            # Normal delivery: within SLA ±1 day
-            delivery_offset = int(rng.integers(-1, 2))
-            actual_delivery = expected_delivery + timedelta(days=delivery_offset)
-
-            po_counter += 1
-            records.append(
-                {
-                    "transaction_id": _build_transaction_id(txn_index),
-                    "date": current_date.strftime("%Y-%m-%d"),
-                    "supplier_id": supplier["id"],
-                    "supplier_name": supplier["name"],
-                    "category": supplier["category"],
-                    "baseline_rate": supplier["baseline_rate"],
-                    "invoice_amount": invoice_amount,
-                    "expected_delivery_date": expected_delivery.strftime("%Y-%m-%d"),
-                    "actual_delivery_date": actual_delivery.strftime("%Y-%m-%d"),
-                    "po_number": f"PO-{po_counter}",
-                    "region": random.choice(regions),
-                    "approved_by": random.choice(approvers),
-                    "is_anomaly": False,
-                    "anomaly_type": "",
-                }
-            )
-            txn_index += 1
+    regions = np.array(
+        ["London", "Manchester", "Birmingham", "Leeds", "Bristol", "Edinburgh"]
+    )
+    approvers = np.array(
+        ["J.Harrison", "S.Patel", "M.Okonkwo", "L.Chen", "R.Fitzgerald"]
+    )
+
+    # Per-day transaction counts drawn in one batch — weekday weighting
+    # keeps weekend volumes low, exactly as the row-by-row version did
+    weekdays = (start_date.weekday() + np.arange(days)) % 7
+    day_means = np.where(weekdays >= 5, max(5, mean_txn * 0.3), mean_txn)
+    counts = np.maximum(1, rng.normal(day_means, std_txn).astype(int))
+    n_total = int(counts.sum())
 
-    df = pd.DataFrame(records)
+    # Flatten to one row per transaction: day_idx maps each row to its date
+    day_idx = np.repeat(np.arange(days), counts)
+    dates = start_day + day_idx
+
+    # Supplier attribute lookup table, indexed by a single integer draw
+    supplier_tbl = _supplier_lookup(suppliers, sla_map)
+
+    # Dedupe categories once so the category column can be built from codes
+    # (several suppliers share a category, so sup_idx is not a valid code)
+    cat_labels, sup_cat_codes = np.unique(
+        supplier_tbl["category"], return_inverse=True
+    )
+
+    sup_idx = rng.integers(0, len(suppliers), size=n_total)
+    baselines = supplier_tbl["baseline"][sup_idx]
+
+    # Invoice amount: ±8% natural price variation around baseline, floor £10
+    invoice_amounts = np.maximum(
+        10.0, np.round(rng.normal(baselines, baselines * 0.08), 2)
+    )
+
+    expected_delivery = dates + supplier_tbl["sla"][sup_idx]
+    # Normal delivery: within SLA ±1 day
+    actual_delivery = expected_delivery + rng.integers(-1, 2, size=n_total)
+
+    txn_numbers = np.arange(1, n_total + 1)
+
+    df = pd.DataFrame(
+        {
+            "transaction_id": np.char.add(
+                "TXN-", np.char.zfill(txn_numbers.astype(str), 6)
+            ),
+            "date": dates.astype("datetime64[ns]"),
+            "supplier_id": supplier_tbl["id"][sup_idx],
+            # Categorical columns built straight from the integer draws —
+            # no intermediate object-string arrays are materialized
+            "supplier_name": pd.Categorical.from_codes(
+                sup_idx, categories=supplier_tbl["name"]
+            ),
+            "category": pd.Categorical.from_codes(
+                sup_cat_codes[sup_idx], categories=cat_labels
+            ),
+            "baseline_rate": baselines,
+            "invoice_amount": invoice_amounts,
+            "expected_delivery_date": expected_delivery.astype("datetime64[ns]"),
+            "actual_delivery_date": actual_delivery.astype("datetime64[ns]"),
+            "po_number": np.char.add("PO-", (10000 + txn_numbers).astype(str)),
+            "region": pd.Categorical.from_codes(
+                rng.integers(0, len(regions), size=n_total), categories=regions
+            ),
+            "approved_by": pd.Categorical.from_codes(
+                rng.integers(0, len(approvers), size=n_total), categories=approvers
+            ),
+            "anomaly_mask": np.zeros(n_total, dtype=np.uint8),
+        }
+    )
     logger.info(
         "Generated %d base transactions across %d days", len(df), days
     )
     return df
 
 
-def _inject_duplicates(
+def _build_duplicate_rows(
     df: pd.DataFrame,
     rate: float,
     rng: np.random.Generator,
 ) -> pd.DataFrame:
-    """Inject duplicate transactions by cloning existing rows ±1 day.
+    """Build duplicate transactions by cloning existing rows ±1 day.
 
     A duplicate is defined as the same supplier + same invoice amount
     appearing within a 1-day window of the original. This simulates
     double-billing by vendors or AP processing errors.
 
+    The clones are returned rather than concatenated here so that
+    generate_dataset can append all extra rows in one concat.
+
     Args:
         df: Base transaction DataFrame.
         rate: Proportion of rows to duplicate (e.g. 0.025 = 2.5%).
         rng: Seeded NumPy random generator.
 
     Returns:
-        DataFrame with duplicate rows appended and flagged.
+        DataFrame of flagged duplicate rows only.
     """
     n_dupes = max(1, int(len(df) * rate))
-    source_indices = rng.choice(df.index, size=n_dupes, replace=False)
+    # Sorted so the clone block keeps ascending transaction IDs — the
+    # final date sort relies on within-block ID order being monotonic
+    source_indices = np.sort(rng.choice(df.index, size=n_dupes, replace=False))
     dupes = df.loc[source_indices].copy()
 
-    for idx in dupes.index:
-        offset = int(rng.choice([-1, 1]))
-        original_date = datetime.strptime(dupes.at[idx, "date"], "%Y-%m-%d")
-        dupes.at[idx, "date"] = (original_date + timedelta(days=offset)).strftime(
-            "%Y-%m-%d"
-        )
-        dupes.at[idx, "transaction_id"] = f"TXN-DUP-{idx:06d}"
-        dupes.at[idx, "po_number"] = f"PO-DUP-{idx}"
-        dupes.at[idx, "is_anomaly"] = True
-        dupes.at[idx, "anomaly_type"] = "duplicate"
-
-    result = pd.concat([df, dupes], ignore_index=True)
+    # Bulk column assignments — one vectorized shift for the whole clone
+    # batch instead of per-row .at dispatch
+    offsets = rng.choice([-1, 1], size=n_dupes)
+    dupes["date"] = dupes["date"] + pd.to_timedelta(offsets, unit="D")
+    dupes["transaction_id"] = "TXN-DUP-" + dupes.index.astype(str).str.zfill(6)
+    dupes["po_number"] = "PO-DUP-" + dupes.index.astype(str)
+    dupes["anomaly_mask"] = dupes["anomaly_mask"] | ANOMALY_DUPLICATE
+
     logger.info("Injected %d duplicate transactions", n_dupes)
-    return result
+    return dupes
 
 
-def _inject_price_overcharges(
+def _inject_row_anomalies(
     df: pd.DataFrame,
-    rate: float,
+    price_rate: float,
+    sla_rate: float,
     rng: np.random.Generator,
 ) -> pd.DataFrame:
-    """Inflate invoice amounts on selected rows to simulate overcharging.
+    """Inject price overcharges and SLA breaches in one fused pass.
+
+    Both anomaly types mutate existing rows in place (unlike duplicates
+    and volume spikes, which append rows), so their index draws, column
+    writes and bitmask updates are fused: each affected column is written
+    exactly once and the mask is OR-merged in a single assignment.
 
     Overcharges are set to 20–45% above baseline to ensure they exceed
-    the configured price_variance_threshold of 15%.
+    the configured price_variance_threshold of 15%; breach delays are
+    drawn from 3–15 days beyond the expected date.
 
     Args:
-        df: Transaction DataFrame.
-        rate: Proportion of rows to inflate.
+        df: Transaction DataFrame (mutated in place and returned).
+        price_rate: Proportion of rows to inflate.
+        sla_rate: Proportion of rows to breach.
         rng: Seeded NumPy random generator.
 
     Returns:
-        DataFrame with invoice_amount inflated on selected rows.
+        DataFrame with both anomaly types applied.
     """
-    n_overcharge = max(1, int(len(df) * rate))
-    indices = rng.choice(df.index, size=n_overcharge, replace=False)
-
-    for idx in indices:
-        multiplier = float(rng.uniform(1.20, 1.45))
-        df.at[idx, "invoice_amount"] = round(
-            df.at[idx, "baseline_rate"] * multiplier, 2
-        )
-        df.at[idx, "is_anomaly"] = True
-        df.at[idx, "anomaly_type"] = (
-            "price_variance"
-            if df.at[idx, "anomaly_type"] == ""
-            else df.at[idx, "anomaly_type"] + "|price_variance"
-        )
-
-    logger.info("Injected %d price overcharge transactions", n_overcharge)
-    return df
-
-
-def _inject_sla_breaches(
-    df: pd.DataFrame,
-    rate: float,
-    rng: np.random.Generator,
-) -> pd.DataFrame:
-    """Push actual_delivery_date beyond the SLA window on selected rows.
-
-    Breach delays are drawn from 3–15 days beyond the expected date,
-    simulating vendor reliability failures.
+    n = len(df)
+    n_overcharge = max(1, int(n * price_rate))
+    n_breach = max(1, int(n * sla_rate))
+    price_idx = rng.choice(n, size=n_overcharge, replace=False)
+    sla_idx = rng.choice(n, size=n_breach, replace=False)
+
+    multipliers = rng.uniform(1.20, 1.45, size=n_overcharge)
+    df.loc[price_idx, "invoice_amount"] = np.round(
+        df["baseline_rate"].to_numpy()[price_idx] * multipliers, 2
+    )
 
-    Args:
-        df: Transaction DataFrame.
-        rate: Proportion of rows to breach.
-        rng: Seeded NumPy random generator.
+    extra_days = rng.integers(3, 16, size=n_breach)
+    df.loc[sla_idx, "actual_delivery_date"] = df[
+        "expected_delivery_date"
+    ].to_numpy()[sla_idx] + extra_days.astype("timedelta64[D]")
 
-    Returns:
-        DataFrame with actual_delivery_date delayed on selected rows.
-    """
-    n_breach = max(1, int(len(df) * rate))
-    indices = rng.choice(df.index, size=n_breach, replace=False)
-
-    for idx in indices:
-        expected = datetime.strptime(df.at[idx, "expected_delivery_date"], "%Y-%m-%d")
-        extra_days = int(rng.integers(3, 16))
-        df.at[idx, "actual_delivery_date"] = (
-            expected + timedelta(days=extra_days)
-        ).strftime("%Y-%m-%d")
-        df.at[idx, "is_anomaly"] = True
-        df.at[idx, "anomaly_type"] = (
-            "sla_breach"
-            if df.at[idx, "anomaly_type"] == ""
-            else df.at[idx, "anomaly_type"] + "|sla_breach"
-        )
+    mask = np.zeros(n, dtype=np.uint8)
+    mask[price_idx] |= ANOMALY_PRICE
+    mask[sla_idx] |= ANOMALY_SLA
+    df["anomaly_mask"] = df["anomaly_mask"].to_numpy() | mask
 
+    logger.info("Injected %d price overcharge transactions", n_overcharge)
     logger.info("Injected %d SLA breach transactions", n_breach)
     return df
 
 
-def _inject_volume_spikes(
+def _build_spike_rows(
     df: pd.DataFrame,
     spike_days: int,
     rng: np.random.Generator,
     cfg: dict[str, Any],
 ) -> pd.DataFrame:
-    """Add burst transactions on selected dates to simulate volume anomalies.
+    """Build burst transactions on selected dates to simulate volume anomalies.
 
-    On spike days, extra transactions are injected (3–5× the daily mean)
+    On spike days, extra transactions are generated (3–5× the daily mean)
     to create outlier counts that exceed the rolling-mean + 2σ threshold.
+    Like the duplicate builder, the rows are returned for a single concat
+    in generate_dataset.
 
     Args:
-        df: Transaction DataFrame.
+        df: Transaction DataFrame (used only to pick spike dates).
         spike_days: Number of distinct days to spike.
         rng: Seeded NumPy random generator.
         cfg: Full configuration dictionary.
 
     Returns:
-        DataFrame with additional spike-day transactions appended.
+        DataFrame of flagged spike-day transactions only.
     """
     gen_cfg = cfg["data_generation"]
     suppliers = gen_cfg["suppliers"]
     sla_map = gen_cfg["sla_days_map"]
     mean_txn = gen_cfg["transactions_per_day_mean"]
-    regions = ["London", "Manchester", "Birmingham", "Leeds", "Bristol", "Edinburgh"]
-    approvers = ["J.Harrison", "S.Patel", "M.Okonkwo", "L.Chen", "R.Fitzgerald"]
+    regions = np.array(
+        ["London", "Manchester", "Birmingham", "Leeds", "Bristol", "Edinburgh"]
+    )
+    approvers = np.array(
+        ["J.Harrison", "S.Patel", "M.Okonkwo", "L.Chen", "R.Fitzgerald"]
+    )
 
-    unique_dates = df["date"].unique()
-    # Avoid the first and last 7 days so the rolling mean has context
+    unique_dates = pd.to_datetime(df["date"].unique())
+    # Avoid the first and last 7 days so the rolling mean has context.
+    # Choose positions rather than values so rng.choice cannot coerce the
+    # datetime64 pool to integers
     spike_date_pool = unique_dates[7:-7]
-    chosen_dates = rng.choice(spike_date_pool, size=min(spike_days, len(spike_date_pool)), replace=False)
-
-    extra_records = []
-    spike_txn_index = 900000
-
-    for spike_date in chosen_dates:
-        n_extra = int(rng.integers(int(mean_txn * 3), int(mean_txn * 5)))
-        for _ in range(n_extra):
-            supplier = suppliers[int(rng.integers(0, len(suppliers)))]
-            sla_days = sla_map.get(supplier["category"], 3)
-            invoice_amount = round(
-                float(rng.normal(supplier["baseline_rate"], supplier["baseline_rate"] * 0.08)),
-                2,
-            )
-            expected_delivery = datetime.strptime(spike_date, "%Y-%m-%d") + timedelta(days=sla_days)
-            actual_delivery = expected_delivery + timedelta(days=int(rng.integers(0, 2)))
-
-            spike_txn_index += 1
-            extra_records.append(
-                {
-                    "transaction_id": f"TXN-SPIKE-{spike_txn_index:06d}",
-                    "date": spike_date,
-                    "supplier_id": supplier["id"],
-                    "supplier_name": supplier["name"],
-                    "category": supplier["category"],
-                    "baseline_rate": supplier["baseline_rate"],
-                    "invoice_amount": max(10.0, invoice_amount),
-                    "expected_delivery_date": expected_delivery.strftime("%Y-%m-%d"),
-                    "actual_delivery_date": actual_delivery.strftime("%Y-%m-%d"),
-                    "po_number": f"PO-SPIKE-{spike_txn_index}",
-                    "region": str(rng.choice(regions)),
-                    "approved_by": str(rng.choice(approvers)),
-                    "is_anomaly": True,
-                    "anomaly_type": "volume_spike",
-                }
-            )
+    chosen = rng.choice(
+        len(spike_date_pool),
+        size=min(spike_days, len(spike_date_pool)),
+        replace=False,
+    )
+    chosen_dates = spike_date_pool[chosen]
+
+    # Batch-draw all spike-row randomness from the shared NumPy generator —
+    # no per-row rng calls or supplier dict lookups in a Python loop
+    supplier_tbl = _supplier_lookup(suppliers, sla_map)
+
+    per_day = rng.integers(
+        int(mean_txn * 3), int(mean_txn * 5), size=len(chosen_dates)
+    )
+    n_extra = int(per_day.sum())
+    spike_dates = np.repeat(chosen_dates.to_numpy(), per_day)
+
+    sup_idx = rng.integers(0, len(suppliers), size=n_extra)
+    baselines = supplier_tbl["baseline"][sup_idx]
+    invoice_amounts = np.maximum(
+        10.0, np.round(rng.normal(baselines, baselines * 0.08), 2)
+    )
+    expected_delivery = spike_dates + supplier_tbl["sla"][sup_idx].astype(
+        "timedelta64[D]"
+    )
+    actual_delivery = expected_delivery + rng.integers(0, 2, size=n_extra).astype(
+        "timedelta64[D]"
+    )
+    txn_numbers = 900000 + np.arange(1, n_extra + 1)
+
+    extra = pd.DataFrame(
+        {
+            "transaction_id": np.char.add(
+                "TXN-SPIKE-", np.char.zfill(txn_numbers.astype(str), 6)
+            ),
+            "date": spike_dates,
+            "supplier_id": supplier_tbl["id"][sup_idx],
+            "supplier_name": supplier_tbl["name"][sup_idx],
+            "category": supplier_tbl["category"][sup_idx],
+            "baseline_rate": baselines,
+            "invoice_amount": invoice_amounts,
+            "expected_delivery_date": expected_delivery,
+            "actual_delivery_date": actual_delivery,
+            "po_number": np.char.add("PO-SPIKE-", txn_numbers.astype(str)),
+            "region": regions[rng.integers(0, len(regions), size=n_extra)],
+            "approved_by": approvers[rng.integers(0, len(approvers), size=n_extra)],
+            "anomaly_mask": np.full(n_extra, ANOMALY_SPIKE, dtype=np.uint8),
+        }
+    )
 
-    result = pd.concat([df, pd.DataFrame(extra_records)], ignore_index=True)
     logger.info(
         "Injected volume spikes on %d days (%d extra transactions)",
         len(chosen_dates),
-        len(extra_records),
+        n_extra,
     )
-    return result
+    return extra
 
 
-def generate_dataset(config_path: str = "config.yaml") -> pd.DataFrame:
+def generate_dataset(config_path: str | dict[str, Any] = "config.yaml") -> pd.DataFrame:
     """Orchestrate full synthetic dataset generation.
 
     Runs base generation followed by all anomaly injection steps in sequence.
     The resulting CSV is written to the path specified in config.yaml.
 
     Args:
-        config_path: Path to configuration YAML file.
+        config_path: Path to configuration YAML file, or an already-parsed
+            config dict.
 
     Returns:
         Complete transaction DataFrame including injected anomalies.
@@ -353,7 +422,7 @@ def generate_dataset(config_path: str = "config.yaml") -> pd.DataFrame:
     Raises:
         OSError: If the output directory cannot be created or written to.
     """
-    cfg = load_config(config_path)
+    cfg = resolve_config(config_path)
     seed = cfg["data_generation"]["seed"]
     rng = np.random.default_rng(seed)
 
@@ -362,18 +431,55 @@ def generate_dataset(config_path: str = "config.yaml") -> pd.DataFrame:
     df = _generate_base_transactions(cfg, rng)
 
     anomaly_rates = cfg["data_generation"]["anomaly_rates"]
-    df = _inject_duplicates(df, anomaly_rates["duplicate_rate"], rng)
-    df = _inject_price_overcharges(df, anomaly_rates["price_overcharge_rate"], rng)
-    df = _inject_sla_breaches(df, anomaly_rates["sla_breach_rate"], rng)
-    df = _inject_volume_spikes(df, anomaly_rates["volume_spike_days"], rng, cfg)
-
-    # Sort by date then transaction ID for a clean presentation
-    df = df.sort_values(["date", "transaction_id"]).reset_index(drop=True)
+    # Row-appending injectors only build their extra frames; the base is
+    # copied into a new block manager once, in a single concat below
+    dup_rows = _build_duplicate_rows(df, anomaly_rates["duplicate_rate"], rng)
+    df = _inject_row_anomalies(
+        df,
+        anomaly_rates["price_overcharge_rate"],
+        anomaly_rates["sla_breach_rate"],
+        rng,
+    )
+    spike_rows = _build_spike_rows(df, anomaly_rates["volume_spike_days"], rng, cfg)
+    df = pd.concat([df, dup_rows, spike_rows], ignore_index=True)
+
+    # Categorical codes shrink the repeated-string columns to small ints
+    # and speed up the groupbys downstream of the CSV round-trip
+    for col in ("supplier_name", "category", "region", "approved_by"):
+        df[col] = df[col].astype("category")
+
+    # Sort by date for a clean presentation. Rows arrive as base →
+    # duplicates → spikes with ascending IDs inside each block, which is
+    # also their lexicographic ID order (TXN- < TXN-DUP- < TXN-SPIKE-), so
+    # a stable argsort on the int64 date view reproduces the old
+    # (date, transaction_id) ordering without object-dtype compares
+    order = np.argsort(df["date"].to_numpy().astype("int64"), kind="stable")
+    df = df.iloc[order].reset_index(drop=True)
+
+    # Expand the uint8 mask into the public is_anomaly / anomaly_type
+    # columns — one vectorized lookup over the 16 possible combinations
+    masks = df.pop("anomaly_mask").to_numpy()
+    df["is_anomaly"] = masks > 0
+    df["anomaly_type"] = pd.Categorical.from_codes(
+        masks.astype(np.int8), categories=_ANOMALY_TYPE_LABELS
+    )
 
-    # Write CSV
+    # Write CSV — dates stay datetime64 in memory and are formatted to ISO
+    # strings only here, at serialization time
     output_path = Path(cfg["paths"]["raw_data"])
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    if _HAVE_PYARROW:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        # date32 casts keep the serialized form at %Y-%m-%d, matching the
+        # pandas writer below
+        for col in ("date", "expected_delivery_date", "actual_delivery_date"):
+            idx = table.schema.get_field_index(col)
+            table = table.set_column(
+                idx, col, table.column(col).cast(pa.date32())
+            )
+        pa_csv.write_csv(table, str(output_path))
+    else:
+        df.to_csv(output_path, index=False, date_format="%Y-%m-%d")
 
     total_anomalies = df["is_anomaly"].sum()
     total_value = df["invoice_amount"].sum()
@@ -14,6 +14,8 @@ Detection Rules:
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -21,8 +23,112 @@ import numpy as np
 import pandas as pd
 import yaml
 
+from src.config import resolve_config
+
+# Numba is optional — when present, the duplicate-window sweep runs as a
+# compiled single-pass scan; otherwise the vectorized NumPy diff is used.
+try:
+    from numba import njit
+
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# PyArrow is optional — when present, transaction_id is loaded as an
+# Arrow-backed string column so membership tests and dedup hashing run in
+# Arrow's C++ kernels instead of Python-hashing object strings.
+try:
+    import pyarrow as pa
+
+    _HAVE_PYARROW = True
+except ImportError:
+    _HAVE_PYARROW = False
+
+# Bottleneck is optional — its move_mean/move_std kernels update the rolling
+# window in a single Welford-style pass instead of re-scanning per position.
+try:
+    import bottleneck as bn
+
+    _HAVE_BOTTLENECK = True
+except ImportError:
+    _HAVE_BOTTLENECK = False
+
 logger = logging.getLogger(__name__)
 
+# Canonical output schema for every detection rule. All four rules return
+# exactly these columns in this order, so the pd.concat in run_detection is
+# a pure column-wise append — no cross-frame alignment or object upcasting.
+# Rule-specific context columns (breach_days, daily_count, ...) are NaN for
+# the rules that don't produce them.
+OUT_COLS = [
+    "transaction_id", "date", "supplier_id", "supplier_name", "category",
+    "baseline_rate", "invoice_amount", "expected_delivery_date",
+    "actual_delivery_date", "po_number", "region", "approved_by",
+    "is_anomaly", "anomaly_type",
+    "rule_triggered", "rule_detail", "leakage_amount_gbp",
+    "breach_days", "daily_count", "rolling_mean", "rolling_std",
+]
+
+
+# Rule-specific context columns carried through _RuleHits.extras
+_EXTRA_COLS = ("breach_days", "daily_count", "rolling_mean", "rolling_std")
+
+
+@dataclass
+class _RuleHits:
+    """Raw output of one detection rule, before any frame is built.
+
+    Rules report positional row indices into the source frame plus the
+    per-hit annotation arrays; the flagged DataFrame is materialized once,
+    in _assemble, instead of once per rule plus a concat.
+    """
+
+    rule: str
+    idx: np.ndarray
+    detail: np.ndarray
+    leakage: np.ndarray
+    extras: dict[str, np.ndarray] = field(default_factory=dict)
+
+
+def _assemble(df: pd.DataFrame, hits_list: list[_RuleHits]) -> pd.DataFrame:
+    """Build the canonical flagged frame from one or more rule hit sets.
+
+    One positional gather (df.iloc on the concatenated indices) allocates
+    the output frame in a single shot; rule annotations and context
+    columns are then filled segment-by-segment from the hit arrays.
+    """
+    sizes = [h.idx.size for h in hits_list]
+    all_idx = np.concatenate([h.idx for h in hits_list])
+
+    out = df.iloc[all_idx].reset_index(drop=True)
+    out["rule_triggered"] = np.repeat([h.rule for h in hits_list], sizes)
+    out["rule_detail"] = np.concatenate([h.detail for h in hits_list])
+    out["leakage_amount_gbp"] = np.concatenate([h.leakage for h in hits_list])
+
+    total = len(out)
+    for col in _EXTRA_COLS:
+        vals = np.full(total, np.nan)
+        start = 0
+        for h, size in zip(hits_list, sizes):
+            if col in h.extras:
+                vals[start:start + size] = h.extras[col]
+            start += size
+        out[col] = vals
+
+    return out.reindex(columns=OUT_COLS)
+
+
+if _HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _dup_scan(key_sorted, days, window_days, out_flag):  # pragma: no cover
+        """Mark rows whose predecessor shares a group key within the window."""
+        for i in range(1, key_sorted.size):
+            if (
+                key_sorted[i] == key_sorted[i - 1]
+                and days[i] - days[i - 1] <= window_days
+            ):
+                out_flag[i] = True
 
 def load_transactions(csv_path: str) -> pd.DataFrame:
     """Load and validate the transactions CSV from disk.
@@ -47,7 +153,50 @@ def load_transactions(csv_path: str) -> pd.DataFrame:
             "Run with --generate-data first."
         )
 
-    df = pd.read_csv(path)
+    # Hand the C parser the target dtypes up front: correctly-typed
+    # columns come out of the single parse pass, so the old post-load
+    # to_datetime/to_numeric coercion sweep (a second full pass over
+    # every coerced column) is gone. category dtype on the low-cardinality
+    # string columns also shrinks the frame and speeds downstream groupbys.
+    # Feather sidecar: repeat loads (threshold tuning, scheduler cycles)
+    # read the Arrow IPC cache instead of re-parsing CSV, as long as the
+    # cache is at least as fresh as the CSV it was built from
+    feather_path = path.with_suffix(".feather")
+    use_cache = (
+        _HAVE_PYARROW
+        and feather_path.exists()
+        and feather_path.stat().st_mtime >= path.stat().st_mtime
+    )
+
+    if use_cache:
+        df = pd.read_feather(feather_path)
+    else:
+        dtypes: dict[str, Any] = {
+            "supplier_id": "category",
+            "supplier_name": "category",
+            "category": "category",
+            "baseline_rate": "float64",
+            "invoice_amount": "float64",
+        }
+        if _HAVE_PYARROW:
+            # supplier_id stays categorical (int codes beat any string
+            # hash); transaction_id is high-cardinality so Arrow strings
+            # win there
+            dtypes["transaction_id"] = pd.ArrowDtype(pa.string())
+
+        df = pd.read_csv(
+            path,
+            dtype=dtypes,
+            parse_dates=["date", "expected_delivery_date", "actual_delivery_date"],
+            engine="c",
+        )
+        if _HAVE_PYARROW:
+            try:
+                df.to_feather(feather_path)
+            except OSError:
+                logger.debug(
+                    "Could not write feather cache to %s", feather_path
+                )
 
     required_columns = {
         "transaction_id", "date", "supplier_id", "supplier_name",
@@ -58,13 +207,6 @@ def load_transactions(csv_path: str) -> pd.DataFrame:
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
-    # Type coercion
-    df["date"] = pd.to_datetime(df["date"])
-    df["expected_delivery_date"] = pd.to_datetime(df["expected_delivery_date"])
-    df["actual_delivery_date"] = pd.to_datetime(df["actual_delivery_date"])
-    df["invoice_amount"] = pd.to_numeric(df["invoice_amount"], errors="coerce")
-    df["baseline_rate"] = pd.to_numeric(df["baseline_rate"], errors="coerce")
-
     logger.info(
         "Loaded %d transactions from %s (date range: %s to %s)",
         len(df),
@@ -89,9 +231,11 @@ def detect_duplicates(
     supplier_id and invoice_amount (rounded to the nearest pound) and their
     dates are within `window_days` of each other.
 
-    The algorithm uses a self-join on supplier_id + rounded_amount, then
-    filters by the absolute day difference. The first occurrence (earliest
-    date) is treated as legitimate; later occurrences are flagged.
+    The algorithm sorts by (supplier, rounded amount, date); within a sorted
+    group, any in-window pair implies an in-window gap to the immediate
+    predecessor, so one vectorized consecutive-diff replaces the pairwise
+    comparison. The first occurrence (earliest date) is treated as
+    legitimate; later occurrences are flagged.
 
     Args:
         df: Full transaction DataFrame.
@@ -102,49 +246,64 @@ def detect_duplicates(
         DataFrame of flagged rows with added columns:
             rule_triggered, rule_detail, leakage_amount_gbp
     """
+    return _assemble(df, [_duplicate_hits(df, window_days)])
+
+
+def _duplicate_hits(df: pd.DataFrame, window_days: int) -> _RuleHits:
+    """Find duplicate rows and return their indices and annotations."""
     logger.info("Running Rule 1: Duplicate Detection (window=%d days)", window_days)
 
-    # Round to nearest pound to absorb floating-point noise
-    df = df.copy()
-    df["_amount_key"] = df["invoice_amount"].round(0)
-
-    # Sort so that, for any duplicate pair, the earlier date comes first
-    df_sorted = df.sort_values("date").reset_index(drop=True)
-
-    # Group by supplier + rounded amount; within each group find rows
-    # where another row exists within window_days
-    flagged_ids = set()
-
-    grouped = df_sorted.groupby(["supplier_id", "_amount_key"])
-    for _, group in grouped:
-        if len(group) < 2:
-            continue
-        dates = group["date"].tolist()
-        txn_ids = group["transaction_id"].tolist()
-        # Check every pair in the group
-        for i in range(len(dates)):
-            for j in range(i + 1, len(dates)):
-                delta = abs((dates[j] - dates[i]).days)
-                if delta <= window_days:
-                    # Flag the later occurrence (index j)
-                    flagged_ids.add(txn_ids[j])
-
-    mask = df["transaction_id"].isin(flagged_ids)
-    flagged = df[mask].copy()
-    flagged["rule_triggered"] = "duplicate"
-    flagged["rule_detail"] = flagged.apply(
-        lambda r: (
-            f"Duplicate of supplier {r['supplier_id']} "
-            f"invoice £{r['invoice_amount']:,.2f} within {window_days}d window"
-        ),
-        axis=1,
+    # Build a single integer group key: supplier codes in the high bits,
+    # the amount rounded to the nearest pound in the low bits. Integer
+    # comparison/sorting beats the multi-column float sort, and rounding
+    # to the pound still absorbs floating-point noise.
+    sup_codes, _ = pd.factorize(df["supplier_id"], sort=False)
+    amt_key = df["invoice_amount"].to_numpy().round().astype(np.int64)
+    group_key = (sup_codes.astype(np.uint64) << np.uint64(32)) | amt_key.astype(
+        np.uint64
     )
-    flagged["leakage_amount_gbp"] = flagged["invoice_amount"]
-
-    df.drop(columns=["_amount_key"], inplace=True)
 
-    logger.info("Rule 1 flagged %d duplicate transactions", len(flagged))
-    return flagged.drop(columns=["_amount_key"], errors="ignore")
+    # Sort so rows of each (supplier, amount) group are contiguous and
+    # date-ascending, then flag any row whose gap to the previous row of
+    # the same group is within the window — no per-group Python loop
+    day_ints = df["date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+    order = np.lexsort((day_ints, group_key))
+
+    key_sorted = group_key[order]
+    days = day_ints[order]
+
+    dup_mask = np.zeros(len(df), dtype=bool)
+    if len(df) > 1:
+        if _HAVE_NUMBA:
+            _dup_scan(key_sorted, days, window_days, dup_mask)
+        else:
+            same_group = key_sorted[1:] == key_sorted[:-1]
+            dup_mask[1:] = same_group & ((days[1:] - days[:-1]) <= window_days)
+
+    mask = np.zeros(len(df), dtype=bool)
+    mask[order[dup_mask]] = True
+    idx = np.flatnonzero(mask)
+
+    amounts = df["invoice_amount"].to_numpy()[idx]
+    # Series concatenation instead of .apply(axis=1) — no per-row boxing
+    if idx.size == 0:
+        detail = np.empty(0, dtype=object)
+    else:
+        detail = (
+            "Duplicate of supplier "
+            + pd.Series(df["supplier_id"].to_numpy()[idx]).astype(str)
+            + " invoice £"
+            + pd.Series(amounts).map("{:,.2f}".format)
+            + f" within {window_days}d window"
+        ).to_numpy()
+
+    logger.info("Rule 1 flagged %d duplicate transactions", idx.size)
+    return _RuleHits(
+        rule="duplicate",
+        idx=idx,
+        detail=detail,
+        leakage=amounts,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -169,41 +328,57 @@ def detect_price_variance(
         DataFrame of flagged rows with leakage estimated as the excess above
         the threshold-adjusted baseline.
     """
+    return _assemble(df, [_price_variance_hits(df, threshold)])
+
+
+def _price_variance_hits(df: pd.DataFrame, threshold: float) -> _RuleHits:
+    """Find overcharged rows and return their indices and annotations."""
     logger.info(
         "Running Rule 2: Price Variance Detection (threshold=%.0f%% over baseline)",
         (threshold - 1) * 100,
     )
 
-    df = df.copy()
-    df["_price_ratio"] = df["invoice_amount"] / df["baseline_rate"]
-    mask = df["_price_ratio"] > threshold
-
-    flagged = df[mask].copy()
-    pct_over = ((flagged["_price_ratio"] - 1) * 100).round(1)
-    flagged["rule_triggered"] = "price_variance"
-    flagged["rule_detail"] = flagged.apply(
-        lambda r: (
-            f"Invoice £{r['invoice_amount']:,.2f} is "
-            f"{((r['_price_ratio'] - 1) * 100):.1f}% above "
-            f"baseline £{r['baseline_rate']:,.2f} "
-            f"(threshold: {(threshold - 1) * 100:.0f}%)"
-        ),
-        axis=1,
-    )
-    # Leakage = amount charged above the threshold-adjusted baseline
-    flagged["leakage_amount_gbp"] = (
-        flagged["invoice_amount"] - flagged["baseline_rate"] * threshold
-    ).round(2)
+    # Cheap multiply-compare pre-filter first (with one part in 1e12 of
+    # slack so rounding in baseline×threshold can't lose a true hit), then
+    # the exact ratio test — the division only runs on candidate rows.
+    # Everything lives in local arrays; df is never copied or mutated
+    invoice = df["invoice_amount"].to_numpy()
+    baseline = df["baseline_rate"].to_numpy()
+    cand_idx = np.flatnonzero(invoice > baseline * (threshold * (1.0 - 1e-12)))
 
-    flagged.drop(columns=["_price_ratio"], inplace=True)
+    ratio_cand = invoice[cand_idx] / baseline[cand_idx]
+    keep = ratio_cand > threshold
+    idx = cand_idx[keep]
+
+    if idx.size == 0:
+        detail = np.empty(0, dtype=object)
+    else:
+        pct_over = pd.Series((ratio_cand[keep] - 1) * 100).round(1)
+        detail = (
+            "Invoice £"
+            + pd.Series(invoice[idx]).map("{:,.2f}".format)
+            + " is "
+            + pct_over.map("{:.1f}".format)
+            + "% above baseline £"
+            + pd.Series(baseline[idx]).map("{:,.2f}".format)
+            + f" (threshold: {(threshold - 1) * 100:.0f}%)"
+        ).to_numpy()
+
+    # Leakage = amount charged above the threshold-adjusted baseline
+    leakage = np.round(invoice[idx] - baseline[idx] * threshold, 2)
 
     logger.info(
         "Rule 2 flagged %d overcharge transactions | "
         "estimated leakage £%.2f",
-        len(flagged),
-        flagged["leakage_amount_gbp"].sum(),
+        idx.size,
+        leakage.sum(),
+    )
+    return _RuleHits(
+        rule="price_variance",
+        idx=idx,
+        detail=detail,
+        leakage=leakage,
     )
-    return flagged
 
 
 # ---------------------------------------------------------------------------
@@ -229,47 +404,63 @@ def detect_sla_breaches(
     Returns:
         DataFrame of flagged rows with breach_days and leakage_amount_gbp.
     """
+    return _assemble(df, [_sla_breach_hits(df, grace_days)])
+
+
+def _sla_breach_hits(df: pd.DataFrame, grace_days: int) -> _RuleHits:
+    """Find late-delivery rows and return their indices and annotations."""
     PENALTY_PER_DAY_GBP = 150.0  # Internal ops cost rate for late delivery
 
     logger.info(
         "Running Rule 3: SLA Breach Detection (grace=%d days)", grace_days
     )
 
-    df = df.copy()
-    df["_breach_days"] = (
-        df["actual_delivery_date"] - df["expected_delivery_date"]
-    ).dt.days - grace_days
+    # Subtract as plain int64 day codes — skips materializing a
+    # timedelta64[ns] Series and the nanosecond→day division behind
+    # .dt.days. breach stays a local array; df is never copied or mutated
+    actual_days = (
+        df["actual_delivery_date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+    )
+    expected_days = (
+        df["expected_delivery_date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+    )
+    breach = actual_days - expected_days - grace_days
 
-    mask = df["_breach_days"] > 0
-    flagged = df[mask].copy()
+    idx = np.flatnonzero(breach > 0)
+    breach_days = breach[idx]
 
-    flagged["rule_triggered"] = "sla_breach"
-    if flagged.empty:
-        flagged["rule_detail"] = pd.Series(dtype=str)
-        flagged["leakage_amount_gbp"] = pd.Series(dtype=float)
-        flagged.rename(columns={"_breach_days": "breach_days"}, inplace=True)
+    if idx.size == 0:
+        detail = np.empty(0, dtype=object)
     else:
-        flagged["rule_detail"] = flagged.apply(
-            lambda r: (
-                f"Delivery {r['_breach_days']:.0f} days late: "
-                f"expected {r['expected_delivery_date'].date()}, "
-                f"actual {r['actual_delivery_date'].date()}"
-            ),
-            axis=1,
-        )
-        flagged["leakage_amount_gbp"] = (
-            flagged["_breach_days"] * PENALTY_PER_DAY_GBP
-        ).round(2)
-        flagged.rename(columns={"_breach_days": "breach_days"}, inplace=True)
+        detail = (
+            "Delivery "
+            + pd.Series(breach_days).astype(str)
+            + " days late: expected "
+            + pd.Series(df["expected_delivery_date"].to_numpy()[idx]).dt.strftime(
+                "%Y-%m-%d"
+            )
+            + ", actual "
+            + pd.Series(df["actual_delivery_date"].to_numpy()[idx]).dt.strftime(
+                "%Y-%m-%d"
+            )
+        ).to_numpy()
+
+    leakage = np.round(breach_days * PENALTY_PER_DAY_GBP, 2)
 
     logger.info(
         "Rule 3 flagged %d SLA breach transactions | "
         "max breach %d days | estimated leakage £%.2f",
-        len(flagged),
-        int(flagged["breach_days"].max()) if len(flagged) > 0 else 0,
-        flagged["leakage_amount_gbp"].sum(),
+        idx.size,
+        int(breach_days.max()) if idx.size > 0 else 0,
+        leakage.sum(),
+    )
+    return _RuleHits(
+        rule="sla_breach",
+        idx=idx,
+        detail=detail,
+        leakage=leakage,
+        extras={"breach_days": breach_days},
     )
-    return flagged
 
 
 # ---------------------------------------------------------------------------
@@ -301,76 +492,99 @@ def detect_volume_spikes(
         DataFrame of flagged rows with spike_count, rolling_mean, rolling_std
         columns added.
     """
+    return _assemble(df, [_volume_spike_hits(df, sigma_threshold, rolling_window)])
+
+
+def _volume_spike_hits(
+    df: pd.DataFrame,
+    sigma_threshold: float,
+    rolling_window: int,
+) -> _RuleHits:
+    """Find spike-day rows and return their indices and annotations."""
     logger.info(
         "Running Rule 4: Volume Spike Detection (sigma=%.1f, window=%d days)",
         sigma_threshold,
         rolling_window,
     )
 
-    daily_counts = (
-        df.groupby("date")
-        .size()
-        .rename("daily_count")
-        .reset_index()
-        .sort_values("date")
-    )
-
-    daily_counts["rolling_mean"] = (
-        daily_counts["daily_count"]
-        .shift(1)
-        .rolling(window=rolling_window, min_periods=3)
-        .mean()
-    )
-    daily_counts["rolling_std"] = (
-        daily_counts["daily_count"]
-        .shift(1)
-        .rolling(window=rolling_window, min_periods=3)
-        .std()
-    )
-    daily_counts["upper_bound"] = (
-        daily_counts["rolling_mean"] + sigma_threshold * daily_counts["rolling_std"]
-    )
-    spike_days = daily_counts[
-        daily_counts["daily_count"] > daily_counts["upper_bound"]
-    ]["date"]
-
-    flagged = df[df["date"].isin(spike_days)].copy()
-
-    # Merge spike stats back for context
-    flagged = flagged.merge(
-        daily_counts[["date", "daily_count", "rolling_mean", "rolling_std"]],
-        on="date",
-        how="left",
-    )
-
-    flagged["rule_triggered"] = "volume_spike"
-    if flagged.empty:
-        flagged["rule_detail"] = pd.Series(dtype=str)
-    else:
-        flagged["rule_detail"] = flagged.apply(
-            lambda r: (
-                f"Date {r['date'].date()}: {r['daily_count']:.0f} transactions "
-                f"(baseline mean={r['rolling_mean']:.1f}, "
-                f"std={r['rolling_std']:.1f}, "
-                f"threshold={r['rolling_mean'] + sigma_threshold * r['rolling_std']:.1f})"
-            ),
-            axis=1,
+    # Daily counts via np.unique on int64 day codes — one pass over the
+    # column, no groupby machinery, and uniq comes back already sorted
+    day_ints = df["date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+    uniq_days, counts = np.unique(day_ints, return_counts=True)
+
+    # Shift-by-one so each day is compared against a baseline that
+    # excludes itself, then one rolling pass over the raw ndarray
+    shifted = np.concatenate(([np.nan], counts[:-1].astype(np.float64)))
+    if _HAVE_BOTTLENECK:
+        rolling_mean = bn.move_mean(shifted, window=rolling_window, min_count=3)
+        rolling_std = bn.move_std(
+            shifted, window=rolling_window, min_count=3, ddof=1
         )
-    flagged["leakage_amount_gbp"] = 0.0  # Flagged for review; no direct £ leakage
+    else:
+        rolling = pd.Series(shifted).rolling(window=rolling_window, min_periods=3)
+        rolling_mean = rolling.mean().to_numpy()
+        rolling_std = rolling.std().to_numpy()
+
+    upper_bound = rolling_mean + sigma_threshold * rolling_std
+    is_spike_day = counts > upper_bound
+
+    # uniq_days is sorted, so one searchsorted maps every row to its
+    # day's slot; the spike mask and the context stats are then plain
+    # positional gathers — no hash join, no merge
+    row_day_pos = np.searchsorted(uniq_days, day_ints)
+    mask = is_spike_day[row_day_pos]
+
+    idx = np.flatnonzero(mask)
+    pos = row_day_pos[idx]
+    day_counts = counts[pos]
+    day_mean = rolling_mean[pos]
+    day_std = rolling_std[pos]
+
+    if idx.size == 0:
+        detail = np.empty(0, dtype=object)
+    else:
+        mean_s = pd.Series(day_mean)
+        std_s = pd.Series(day_std)
+        detail = (
+            "Date "
+            + pd.Series(df["date"].to_numpy()[idx]).dt.strftime("%Y-%m-%d")
+            + ": "
+            + pd.Series(day_counts).astype(str)
+            + " transactions (baseline mean="
+            + mean_s.map("{:.1f}".format)
+            + ", std="
+            + std_s.map("{:.1f}".format)
+            + ", threshold="
+            + (mean_s + sigma_threshold * std_s).map("{:.1f}".format)
+            + ")"
+        ).to_numpy()
 
     logger.info(
         "Rule 4 flagged %d transactions across %d spike days",
-        len(flagged),
-        spike_days.nunique(),
+        idx.size,
+        int(is_spike_day.sum()),
+    )
+    return _RuleHits(
+        rule="volume_spike",
+        idx=idx,
+        detail=detail,
+        # Flagged for review; no direct £ leakage
+        leakage=np.zeros(idx.size),
+        extras={
+            "daily_count": day_counts,
+            "rolling_mean": day_mean,
+            "rolling_std": day_std,
+        },
     )
-    return flagged
 
 
 # ---------------------------------------------------------------------------
 # Orchestrator
 # ---------------------------------------------------------------------------
 
-def run_detection(config_path: str = "config.yaml") -> tuple[pd.DataFrame, dict[str, Any]]:
+def run_detection(
+    config_path: str | dict[str, Any] = "config.yaml",
+) -> tuple[pd.DataFrame, dict[str, Any]]:
     """Run the full detection pipeline and return annotated results.
 
     Loads configuration, reads the transaction CSV, applies all four
@@ -379,44 +593,59 @@ def run_detection(config_path: str = "config.yaml") -> tuple[pd.DataFrame, dict[
     appears exactly once.
 
     Args:
-        config_path: Path to configuration YAML.
+        config_path: Path to configuration YAML, or an already-parsed
+            config dict (skips re-parsing).
 
     Returns:
         Tuple of:
             flagged_df  — DataFrame of all flagged (transaction, rule) pairs
             summary     — Dict with aggregate stats for downstream reporting
     """
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
+    cfg = resolve_config(config_path)
 
     det_cfg = cfg["detection"]
     df = load_transactions(cfg["paths"]["raw_data"])
 
-    results = []
-
-    results.append(
-        detect_duplicates(df, window_days=det_cfg["duplicate_window_days"])
-    )
-    results.append(
-        detect_price_variance(df, threshold=det_cfg["price_variance_threshold"])
-    )
-    results.append(
-        detect_sla_breaches(df, grace_days=det_cfg["sla_grace_days"])
-    )
-    results.append(
-        detect_volume_spikes(
-            df,
-            sigma_threshold=det_cfg["volume_spike_sigma"],
-            rolling_window=det_cfg["volume_rolling_window"],
-        )
-    )
-
-    flagged = pd.concat(results, ignore_index=True)
-
-    # Ensure each (transaction, rule) pair is unique
-    flagged = flagged.drop_duplicates(
-        subset=["transaction_id", "rule_triggered"]
-    ).reset_index(drop=True)
+    # Coalesce same-dtype columns into contiguous blocks before the rule
+    # threads fan out. All four rules read this one frame, so contiguous
+    # float64/datetime blocks keep their vector ops on prefetch-friendly
+    # memory instead of scattered single-column blocks.
+    df._consolidate_inplace()
+
+    # The four rules are independent reads of df, and their heavy work
+    # happens in pandas/NumPy kernels that release the GIL — fan them out
+    # across threads so wall time approaches the slowest single rule
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(
+                _duplicate_hits, df, det_cfg["duplicate_window_days"]
+            ),
+            executor.submit(
+                _price_variance_hits, df, det_cfg["price_variance_threshold"]
+            ),
+            executor.submit(
+                _sla_breach_hits, df, det_cfg["sla_grace_days"]
+            ),
+            executor.submit(
+                _volume_spike_hits,
+                df,
+                det_cfg["volume_spike_sigma"],
+                det_cfg["volume_rolling_window"],
+            ),
+        ]
+        hits = [future.result() for future in futures]
+
+    # One gather into one output frame — no per-rule intermediate frames
+    # and no concat alignment pass
+    flagged = _assemble(df, hits)
+
+    # Each rule runs exactly once and emits unique transaction_ids, so a
+    # (transaction, rule) pair can never repeat — assert the invariant in
+    # debug builds rather than paying a hash pass to drop nothing
+    if __debug__:
+        assert not flagged.duplicated(
+            subset=["transaction_id", "rule_triggered"]
+        ).any(), "duplicate (transaction_id, rule_triggered) pairs in rule output"
 
     summary = {
         "total_transactions": len(df),
@@ -12,13 +12,17 @@ Sheets:
     3. Statistics       — Rule performance metrics and daily trend table
 """
 
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from openpyxl import Workbook
+from openpyxl.cell import Cell
 from openpyxl.chart import BarChart, Reference
 from openpyxl.chart.series import SeriesLabel
 from openpyxl.styles import (
@@ -30,11 +34,26 @@ from openpyxl.styles import (
     Side,
 )
 from openpyxl.utils import get_column_letter
-from openpyxl.utils.dataframe import dataframe_to_rows
 import yaml
 
+from src.config import resolve_config
+
+# xlsxwriter is optional — it serializes large sheets measurably faster
+# than openpyxl, so when present the whole workbook is written through it
+# once the flagged table is big enough to dominate; the openpyxl path
+# below remains the default (and keeps its startup cost for small runs).
+try:
+    import xlsxwriter
+
+    _HAVE_XLSXWRITER = True
+except ImportError:
+    _HAVE_XLSXWRITER = False
+
 logger = logging.getLogger(__name__)
 
+# Flagged-row count above which the xlsxwriter backend takes over
+_XLSXWRITER_ROW_THRESHOLD = 10_000
+
 # ---------------------------------------------------------------------------
 # Colour palette (consistent with brand / Power BI standard colours)
 # ---------------------------------------------------------------------------
@@ -67,22 +86,49 @@ THIN_BORDER = Border(
     bottom=Side(style="thin"),
 )
 
+# One PatternFill per severity, shared by every cell of every row in that
+# colour — constructing a fresh fill per cell makes openpyxl hash and
+# dedupe thousands of identical style objects
+_SEVERITY_FILLS = {
+    sev: PatternFill(fill_type="solid", fgColor=colour)
+    for sev, colour in SEVERITY_ROW_COLOURS.items()
+}
+_DEFAULT_ROW_FILL = PatternFill(fill_type="solid", fgColor=COLOURS["light_grey"])
+_ROW_ALIGNMENT = Alignment(wrap_text=False, vertical="center")
+
+# Shared Alignment objects — one instance per orientation instead of a
+# fresh allocation per styled cell
+_CENTER = Alignment(horizontal="center", vertical="center")
+_CENTER_H = Alignment(horizontal="center")
+_CENTER_WRAP = Alignment(horizontal="center", wrap_text=True)
+_LEFT = Alignment(horizontal="left")
+_RIGHT = Alignment(horizontal="right")
 
+
+@functools.lru_cache(maxsize=None)
 def _make_header_fill(hex_colour: str) -> PatternFill:
-    """Create a solid PatternFill for header cells."""
+    """Return the shared solid PatternFill for this colour."""
     return PatternFill(fill_type="solid", fgColor=hex_colour)
 
 
+@functools.lru_cache(maxsize=None)
 def _make_header_font(bold: bool = True) -> Font:
-    """Create white, bold header font."""
+    """Return the shared white header font."""
     return Font(name="Calibri", bold=bold, color=COLOURS["header_font"], size=11)
 
 
+@functools.lru_cache(maxsize=None)
 def _make_title_font(size: int = 14) -> Font:
-    """Create large bold title font in navy."""
+    """Return the shared bold navy title font for this size."""
     return Font(name="Calibri", bold=True, color=COLOURS["navy"], size=size)
 
 
+@functools.lru_cache(maxsize=None)
+def _make_kpi_value_font(colour: str) -> Font:
+    """Return the shared large bold font for a KPI value in this colour."""
+    return Font(name="Calibri", bold=True, size=16, color=colour)
+
+
 def _auto_fit_columns(ws, min_width: int = 10, max_width: int = 60) -> None:
     """Iterate all columns and set width to the longest cell value.
 
@@ -104,13 +150,41 @@ def _auto_fit_columns(ws, min_width: int = 10, max_width: int = 60) -> None:
         ws.column_dimensions[col_letter].width = adjusted
 
 
+def _auto_fit_from_df(
+    ws,
+    df: pd.DataFrame,
+    min_width: int = 10,
+    max_width: int = 60,
+) -> None:
+    """Set column widths from the source DataFrame in one vectorized pass.
+
+    Widths come from the frame the sheet was written from — max string
+    length per column via pandas' C string kernels — so there is no need
+    to re-read every written cell the way _auto_fit_columns does.
+
+    Args:
+        ws: openpyxl Worksheet object.
+        df: DataFrame the sheet's data rows were written from.
+        min_width: Minimum column width in character units.
+        max_width: Maximum column width to prevent overly wide columns.
+    """
+    header_len = np.array([len(str(h)) for h in df.columns])
+    data_len = np.nan_to_num(
+        df.astype(str).apply(lambda s: s.str.len().max()).to_numpy(dtype=float)
+    )
+    widths = np.clip(np.maximum(header_len, data_len) + 4, min_width, max_width)
+    for i, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(i)].width = int(width)
+
+
 def _write_kpi_tile(
     ws,
     row: int,
     col: int,
     label: str,
-    value: str,
+    value: float | int | str,
     colour: str,
+    number_format: str | None = None,
 ) -> None:
     """Write a two-cell KPI tile (label above, value below) with styling.
 
@@ -119,20 +193,24 @@ def _write_kpi_tile(
         row: Starting row for the label cell.
         col: Column for the tile.
         label: KPI name string.
-        value: KPI value string.
+        value: KPI value — raw numbers stay numeric in the cell so Excel
+            can sort/aggregate them; display comes from number_format.
         colour: Hex colour for the label background.
+        number_format: Optional Excel number format for the value cell.
     """
     label_cell = ws.cell(row=row, column=col, value=label)
     label_cell.fill = _make_header_fill(colour)
     label_cell.font = _make_header_font()
-    label_cell.alignment = Alignment(horizontal="center", vertical="center")
+    label_cell.alignment = _CENTER
     label_cell.border = THIN_BORDER
 
     value_cell = ws.cell(row=row + 1, column=col, value=value)
-    value_cell.font = Font(name="Calibri", bold=True, size=16, color=colour)
-    value_cell.alignment = Alignment(horizontal="center", vertical="center")
+    value_cell.font = _make_kpi_value_font(colour)
+    value_cell.alignment = _CENTER
     value_cell.fill = _make_header_fill(COLOURS["light_grey"])
     value_cell.border = THIN_BORDER
+    if number_format:
+        value_cell.number_format = number_format
 
 
 def _build_summary_sheet(
@@ -157,7 +235,7 @@ def _build_summary_sheet(
     title.value = "OPERATIONS COST LEAKAGE DETECTOR — EXECUTIVE SUMMARY"
     title.font = Font(name="Calibri", bold=True, size=16, color=COLOURS["white"])
     title.fill = _make_header_fill(COLOURS["navy"])
-    title.alignment = Alignment(horizontal="center", vertical="center")
+    title.alignment = _CENTER
 
     ws.merge_cells("A2:H2")
     sub = ws["A2"]
@@ -167,21 +245,26 @@ def _build_summary_sheet(
         f"Organisation: Acme Operations Ltd"
     )
     sub.font = Font(name="Calibri", italic=True, size=10, color=COLOURS["navy"])
-    sub.alignment = Alignment(horizontal="center", vertical="center")
+    sub.alignment = _CENTER
 
     # --- KPI Tiles row 4–5 ---
+    # Raw numbers go into the cells; Excel number formats handle display.
+    # Numeric cells are sortable in Excel and smaller in the XLSX XML
     sev = summary["severity_breakdown"]
     kpi_tiles = [
-        ("TOTAL LEAKAGE",    f"£{summary['headline_gbp']:,.2f}",       COLOURS["dark_red"]),
-        ("TRANSACTIONS",     f"{summary['total_transactions_analysed']:,}",  COLOURS["navy"]),
-        ("FLAGS RAISED",     f"{summary['total_flags']:,}",             COLOURS["navy"]),
-        ("CRITICAL",         str(sev.get("Critical", 0)),               "CC0000"),
-        ("HIGH",             str(sev.get("High", 0)),                   "C65911"),
-        ("MEDIUM",           str(sev.get("Medium", 0)),                 COLOURS["gold"]),
-        ("LOW",              str(sev.get("Low", 0)),                    COLOURS["dark_green"]),
+        ("TOTAL LEAKAGE",    summary["headline_gbp"],              '"£"#,##0.00', COLOURS["dark_red"]),
+        ("TRANSACTIONS",     summary["total_transactions_analysed"], "#,##0",     COLOURS["navy"]),
+        ("FLAGS RAISED",     summary["total_flags"],               "#,##0",       COLOURS["navy"]),
+        ("CRITICAL",         sev.get("Critical", 0),               "#,##0",       "CC0000"),
+        ("HIGH",             sev.get("High", 0),                   "#,##0",       "C65911"),
+        ("MEDIUM",           sev.get("Medium", 0),                 "#,##0",       COLOURS["gold"]),
+        ("LOW",              sev.get("Low", 0),                    "#,##0",       COLOURS["dark_green"]),
     ]
-    for i, (label, value, colour) in enumerate(kpi_tiles, start=1):
-        _write_kpi_tile(ws, row=4, col=i, label=label, value=value, colour=colour)
+    for i, (label, value, fmt, colour) in enumerate(kpi_tiles, start=1):
+        _write_kpi_tile(
+            ws, row=4, col=i, label=label, value=value, colour=colour,
+            number_format=fmt,
+        )
     ws.row_dimensions[4].height = 22
     ws.row_dimensions[5].height = 30
 
@@ -192,7 +275,7 @@ def _build_summary_sheet(
         cell = ws.cell(row=8, column=col_i, value=h)
         cell.fill = _make_header_fill(COLOURS["navy"])
         cell.font = _make_header_font()
-        cell.alignment = Alignment(horizontal="center")
+        cell.alignment = _CENTER_H
         cell.border = THIN_BORDER
 
     rule_display = {
@@ -217,7 +300,7 @@ def _build_summary_sheet(
             cell.border = THIN_BORDER
             if col_i in (2, 3):
                 cell.number_format = "#,##0.00" if col_i == 3 else "#,##0"
-            cell.alignment = Alignment(horizontal="right" if col_i > 1 else "left")
+            cell.alignment = _RIGHT if col_i > 1 else _LEFT
 
     # --- Top 5 Suppliers table (col 6) ---
     ws.cell(row=7, column=6, value="TOP 5 SUPPLIERS BY LEAKAGE").font = _make_title_font(12)
@@ -237,15 +320,18 @@ def _build_summary_sheet(
     _auto_fit_columns(ws)
 
 
-def _build_flagged_sheet(ws, scored: pd.DataFrame) -> None:
-    """Write all flagged transactions with severity-coded row colours.
+def _flagged_display_frame(scored: pd.DataFrame) -> pd.DataFrame:
+    """Select and rename the columns shown on the Flagged Items sheet.
+
+    Shared by the openpyxl and xlsxwriter backends so both write the
+    same table.
 
     Args:
-        ws: openpyxl Worksheet (Flagged Items tab).
         scored: Scored DataFrame from scorer.score_flagged_transactions().
-    """
-    ws.sheet_properties.tabColor = COLOURS["dark_red"]
 
+    Returns:
+        Display-ready frame with friendly column headers.
+    """
     display_cols = [
         "transaction_id", "date", "supplier_name", "category", "region",
         "invoice_amount", "baseline_rate", "leakage_amount_gbp",
@@ -254,7 +340,6 @@ def _build_flagged_sheet(ws, scored: pd.DataFrame) -> None:
     ]
     # Only include columns that exist
     display_cols = [c for c in display_cols if c in scored.columns]
-    df_display = scored[display_cols].copy()
 
     # Friendly column headers
     col_rename = {
@@ -273,7 +358,19 @@ def _build_flagged_sheet(ws, scored: pd.DataFrame) -> None:
         "action_required":   "Action Required",
         "approved_by":       "Approved By",
     }
-    df_display = df_display.rename(columns=col_rename)
+    return scored[display_cols].copy().rename(columns=col_rename)
+
+
+def _build_flagged_sheet(ws, scored: pd.DataFrame) -> None:
+    """Write all flagged transactions with severity-coded row colours.
+
+    Args:
+        ws: openpyxl Worksheet (Flagged Items tab).
+        scored: Scored DataFrame from scorer.score_flagged_transactions().
+    """
+    ws.sheet_properties.tabColor = COLOURS["dark_red"]
+
+    df_display = _flagged_display_frame(scored)
 
     # Write header row
     header_row = list(df_display.columns)
@@ -281,43 +378,147 @@ def _build_flagged_sheet(ws, scored: pd.DataFrame) -> None:
         cell = ws.cell(row=1, column=col_i, value=h)
         cell.fill = _make_header_fill(COLOURS["dark_red"])
         cell.font = _make_header_font()
-        cell.alignment = Alignment(horizontal="center", wrap_text=True)
+        cell.alignment = _CENTER_WRAP
         cell.border = THIN_BORDER
 
     ws.row_dimensions[1].height = 24
     ws.freeze_panes = "A2"
 
-    # Write data rows with severity colouring
-    severity_col_idx = header_row.index("Severity") + 1 if "Severity" in header_row else None
+    # Stream data rows through ws.append — one call per row instead of a
+    # ws.cell dict lookup per cell, with all styles drawn from the shared
+    # module-level caches
+    currency_cols = {i for i, name in enumerate(header_row) if "(£)" in name}
+
+    # Resolve each row's fill in one pass over the severity column instead
+    # of a tuple index + dict probe per row inside the write loop
+    if "Severity" in df_display.columns:
+        row_fills = [
+            _SEVERITY_FILLS.get(sev, _DEFAULT_ROW_FILL)
+            for sev in df_display["Severity"].astype(str).to_numpy()
+        ]
+    else:
+        row_fills = [_DEFAULT_ROW_FILL] * len(df_display)
 
-    for row_i, row in enumerate(
-        dataframe_to_rows(df_display, index=False, header=False), start=2
+    for fill, row_vals in zip(
+        row_fills, df_display.itertuples(index=False, name=None)
     ):
-        severity = str(row[severity_col_idx - 1]) if severity_col_idx else "Low"
-        row_colour = SEVERITY_ROW_COLOURS.get(severity, COLOURS["light_grey"])
-        fill = _make_header_fill(row_colour)
-
-        for col_i, val in enumerate(row, start=1):
-            cell = ws.cell(row=row_i, column=col_i, value=val)
+        cells = []
+        for col_i, val in enumerate(row_vals):
+            cell = Cell(ws, value=val)
             cell.fill = fill
             cell.border = THIN_BORDER
-            cell.alignment = Alignment(wrap_text=False, vertical="center")
-            # Format currency columns
-            col_name = header_row[col_i - 1]
-            if "(£)" in col_name:
+            cell.alignment = _ROW_ALIGNMENT
+            if col_i in currency_cols:
                 cell.number_format = "#,##0.00"
+            cells.append(cell)
+        ws.append(cells)
 
     # Auto-filter
     ws.auto_filter.ref = f"A1:{get_column_letter(len(header_row))}1"
-    _auto_fit_columns(ws)
+    _auto_fit_from_df(ws, df_display)
+
+
+def _rule_metrics(scored: pd.DataFrame) -> list[list[Any]]:
+    """Aggregate per-rule performance rows for the Statistics sheet.
+
+    Split out from the sheet builder so the groupby (pandas C code,
+    releases the GIL) can run in a background thread while the flagged
+    sheet's cell-write loop holds the GIL in the main thread.
+
+    Args:
+        scored: Scored DataFrame.
+
+    Returns:
+        One row per rule: display name, flag count, severity counts,
+        total / average / max leakage.
+    """
+    rule_display = {
+        "duplicate":      "Duplicate Transactions",
+        "price_variance": "Price Variance",
+        "sla_breach":     "SLA Breach",
+        "volume_spike":   "Volume Spike",
+    }
+    rows = []
+    for rule, grp in scored.groupby("rule_triggered", observed=True):
+        sev_counts = grp["severity"].value_counts()
+        total_leak = grp["leakage_amount_gbp"].sum()
+        rows.append(
+            [
+                rule_display.get(rule, rule),
+                len(grp),
+                sev_counts.get("Critical", 0),
+                sev_counts.get("High", 0),
+                sev_counts.get("Medium", 0),
+                sev_counts.get("Low", 0),
+                round(total_leak, 2),
+                round(total_leak / len(grp), 2) if len(grp) > 0 else 0,
+                round(grp["leakage_amount_gbp"].max(), 2),
+            ]
+        )
+    return rows
+
+
+def _daily_trend(scored: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate the daily flags/leakage/critical trend table.
+
+    Split out from the sheet builder for the same background-thread
+    overlap as _rule_metrics.
+
+    Args:
+        scored: Scored DataFrame.
+
+    Returns:
+        One row per day with flags, critical counts, and leakage_gbp —
+        the column order of the written Daily Leakage Trend table.
+    """
+    # Bucket with a daily Grouper on the datetime column — int64 code
+    # arithmetic, versus .dt.date which materialises and hashes a Python
+    # date object per row. Critical is pre-flagged as an int column so the
+    # per-bucket agg is a plain sum rather than a Python lambda
+    date_series = scored["date"]
+    if not pd.api.types.is_datetime64_any_dtype(date_series):
+        date_series = pd.to_datetime(date_series, format="ISO8601")
+
+    daily = (
+        pd.DataFrame(
+            {
+                "date": date_series,
+                "leakage_gbp": scored["leakage_amount_gbp"].to_numpy(),
+                "critical": (
+                    scored["severity"].to_numpy() == "Critical"
+                ).astype(np.int32),
+            }
+        )
+        .groupby(pd.Grouper(key="date", freq="D"))
+        .agg(
+            flags=("leakage_gbp", "count"),
+            critical=("critical", "sum"),
+            leakage_gbp=("leakage_gbp", "sum"),
+        )
+        .reset_index()
+    )
+    # Grouper emits empty calendar-day bins; drop them and go back to
+    # plain dates so the written cells match the previous layout
+    daily = daily[daily["flags"] > 0].reset_index(drop=True)
+    daily["date"] = daily["date"].dt.date
+    return daily
 
 
-def _build_statistics_sheet(ws, scored: pd.DataFrame) -> None:
+def _build_statistics_sheet(
+    ws,
+    rule_rows: list[list[Any]],
+    daily: pd.DataFrame,
+    include_chart: bool = True,
+) -> None:
     """Write rule performance metrics and a daily leakage trend table.
 
     Args:
         ws: openpyxl Worksheet (Statistics tab).
-        scored: Scored DataFrame.
+        rule_rows: Pre-aggregated rows from _rule_metrics().
+        daily: Pre-aggregated trend frame from _daily_trend().
+        include_chart: Embed the daily leakage bar chart. Programmatic
+            runs that only read the tables can turn this off in config
+            and skip the chart serialization entirely.
     """
     ws.sheet_properties.tabColor = COLOURS["dark_green"]
 
@@ -333,54 +534,23 @@ def _build_statistics_sheet(ws, scored: pd.DataFrame) -> None:
         cell.fill = _make_header_fill(COLOURS["dark_green"])
         cell.font = _make_header_font()
         cell.border = THIN_BORDER
-        cell.alignment = Alignment(horizontal="center")
-
-    rule_display = {
-        "duplicate":      "Duplicate Transactions",
-        "price_variance": "Price Variance",
-        "sla_breach":     "SLA Breach",
-        "volume_spike":   "Volume Spike",
-    }
+        cell.alignment = _CENTER_H
 
-    for row_i, (rule, grp) in enumerate(
-        scored.groupby("rule_triggered"), start=3
-    ):
-        sev_counts = grp["severity"].value_counts()
-        total_leak = grp["leakage_amount_gbp"].sum()
-        row_data = [
-            rule_display.get(rule, rule),
-            len(grp),
-            sev_counts.get("Critical", 0),
-            sev_counts.get("High", 0),
-            sev_counts.get("Medium", 0),
-            sev_counts.get("Low", 0),
-            round(total_leak, 2),
-            round(total_leak / len(grp), 2) if len(grp) > 0 else 0,
-            round(grp["leakage_amount_gbp"].max(), 2),
-        ]
+    # ws.append writes below _current_row — position it under the header
+    # and stream pre-styled cells, one append per rule row
+    ws._current_row = 2
+    for row_data in rule_rows:
+        cells = []
         for col_i, val in enumerate(row_data, start=1):
-            cell = ws.cell(row=row_i, column=col_i, value=val)
-            cell.fill = _make_header_fill(COLOURS["light_grey"])
+            cell = Cell(ws, value=val)
+            cell.fill = _DEFAULT_ROW_FILL
             cell.border = THIN_BORDER
             if col_i > 6:
                 cell.number_format = "#,##0.00"
+            cells.append(cell)
+        ws.append(cells)
 
     # --- Daily leakage trend table ---
-    scored_with_date = scored.copy()
-    if not pd.api.types.is_datetime64_any_dtype(scored_with_date["date"]):
-        scored_with_date["date"] = pd.to_datetime(scored_with_date["date"])
-
-    daily = (
-        scored_with_date.groupby(scored_with_date["date"].dt.date)
-        .agg(
-            flags=("transaction_id", "count"),
-            leakage_gbp=("leakage_amount_gbp", "sum"),
-            critical=("severity", lambda s: (s == "Critical").sum()),
-        )
-        .reset_index()
-        .rename(columns={"date": "Date"})
-    )
-
     start_row = 10
     ws.cell(row=start_row, column=1, value="DAILY LEAKAGE TREND").font = _make_title_font()
     daily_headers = ["Date", "Flags", "Critical", "Total Leakage (£)"]
@@ -390,19 +560,22 @@ def _build_statistics_sheet(ws, scored: pd.DataFrame) -> None:
         cell.font = _make_header_font()
         cell.border = THIN_BORDER
 
-    for row_i, row in enumerate(
-        dataframe_to_rows(daily, index=False, header=False),
-        start=start_row + 2,
-    ):
+    ws._current_row = start_row + 1
+    for row in daily.itertuples(index=False, name=None):
+        cells = []
         for col_i, val in enumerate(row, start=1):
-            cell = ws.cell(row=row_i, column=col_i, value=val)
-            cell.fill = _make_header_fill(COLOURS["light_grey"])
+            cell = Cell(ws, value=val)
+            cell.fill = _DEFAULT_ROW_FILL
             cell.border = THIN_BORDER
             if col_i == 4:
                 cell.number_format = "#,##0.00"
+            cells.append(cell)
+        ws.append(cells)
 
-    # Embed a simple bar chart: daily leakage
-    if len(daily) > 1:
+    # Embed a simple bar chart: daily leakage. Charts are the expensive
+    # part of this sheet — skipped for empty/single-day inputs and when
+    # config turns them off
+    if include_chart and len(daily) > 1:
         chart = BarChart()
         chart.type = "col"
         chart.title = "Daily Estimated Leakage (£)"
@@ -412,9 +585,12 @@ def _build_statistics_sheet(ws, scored: pd.DataFrame) -> None:
         chart.height = 12
         chart.width = 22
 
+        # Explicit max_col pins the reference bounds so openpyxl does not
+        # probe the sheet to discover them
         data_ref = Reference(
             ws,
             min_col=4,
+            max_col=4,
             min_row=start_row + 1,
             max_row=start_row + 1 + len(daily),
         )
@@ -424,17 +600,220 @@ def _build_statistics_sheet(ws, scored: pd.DataFrame) -> None:
     _auto_fit_columns(ws)
 
 
+def _generate_report_xlsxwriter(
+    output_path: Path,
+    scored: pd.DataFrame,
+    summary: dict[str, Any],
+    run_date: str,
+    rule_rows: list[list[Any]],
+    daily: pd.DataFrame,
+) -> None:
+    """Write the full workbook with xlsxwriter for large flagged tables.
+
+    xlsxwriter serializes big sheets faster than openpyxl, so above
+    _XLSXWRITER_ROW_THRESHOLD rows the whole report goes through it:
+    pre-created Format objects (one per severity/number-format pair,
+    reused for every cell) and plain write() calls, with the daily chart
+    emitted via add_chart. The layout mirrors the openpyxl sheets.
+
+    Args:
+        output_path: Destination .xlsx path.
+        scored: Scored DataFrame.
+        summary: Executive summary dict.
+        run_date: ISO date string for the report header.
+        rule_rows: Pre-aggregated rows from _rule_metrics().
+        daily: Pre-aggregated trend frame from _daily_trend().
+    """
+    wb = xlsxwriter.Workbook(
+        str(output_path),
+        {"default_date_format": "yyyy-mm-dd", "nan_inf_to_errors": True,
+         "remove_timezone": True},
+    )
+
+    def header_fmt(colour: str):
+        return wb.add_format(
+            {"bold": True, "font_color": COLOURS["header_font"],
+             "bg_color": colour, "border": 1, "align": "center"}
+        )
+
+    title_fmt = wb.add_format(
+        {"bold": True, "font_size": 16, "font_color": COLOURS["white"],
+         "bg_color": COLOURS["navy"], "align": "center", "valign": "vcenter"}
+    )
+    section_fmt = wb.add_format(
+        {"bold": True, "font_size": 12, "font_color": COLOURS["navy"]}
+    )
+    currency_fmt = wb.add_format({"num_format": "#,##0.00", "border": 1})
+    plain_fmt = wb.add_format({"border": 1})
+    plain_date_fmt = wb.add_format({"border": 1, "num_format": "yyyy-mm-dd"})
+
+    # --- Summary ---
+    ws = wb.add_worksheet("Summary")
+    ws.merge_range(0, 0, 0, 7,
+                   "OPERATIONS COST LEAKAGE DETECTOR — EXECUTIVE SUMMARY",
+                   title_fmt)
+    ws.write(
+        1, 0,
+        f"Report Date: {run_date}  |  "
+        f"Analysis Period: {summary['date_range']['start']} → "
+        f"{summary['date_range']['end']}",
+    )
+    sev = summary["severity_breakdown"]
+    kpi_tiles = [
+        ("TOTAL LEAKAGE",  summary["headline_gbp"],                '"£"#,##0.00', COLOURS["dark_red"]),
+        ("TRANSACTIONS",   summary["total_transactions_analysed"], "#,##0",       COLOURS["navy"]),
+        ("FLAGS RAISED",   summary["total_flags"],                 "#,##0",       COLOURS["navy"]),
+        ("CRITICAL",       sev.get("Critical", 0),                 "#,##0",       "CC0000"),
+        ("HIGH",           sev.get("High", 0),                     "#,##0",       "C65911"),
+        ("MEDIUM",         sev.get("Medium", 0),                   "#,##0",       COLOURS["gold"]),
+        ("LOW",            sev.get("Low", 0),                      "#,##0",       COLOURS["dark_green"]),
+    ]
+    for col_i, (label, value, fmt, colour) in enumerate(kpi_tiles):
+        ws.write(3, col_i, label, header_fmt(colour))
+        ws.write(
+            4, col_i, value,
+            wb.add_format({"bold": True, "font_size": 16,
+                           "font_color": colour, "border": 1,
+                           "align": "center", "num_format": fmt,
+                           "bg_color": COLOURS["light_grey"]}),
+        )
+
+    ws.write(6, 0, "LEAKAGE BY DETECTION RULE", section_fmt)
+    navy_header = header_fmt(COLOURS["navy"])
+    for col_i, h in enumerate(["Rule", "Flags", "Est. Leakage (£)", "% of Total"]):
+        ws.write(7, col_i, h, navy_header)
+    rule_display = {
+        "duplicate":      "Duplicate Transactions",
+        "price_variance": "Price Variance / Overcharge",
+        "sla_breach":     "SLA Breach",
+        "volume_spike":   "Volume Spike",
+    }
+    total_leakage = summary["headline_gbp"] or 1
+    for row_i, (rule, data) in enumerate(summary["by_rule"].items(), start=8):
+        leakage = data.get("leakage_gbp", 0)
+        ws.write(row_i, 0, rule_display.get(rule, rule), plain_fmt)
+        ws.write(row_i, 1, data.get("count", 0), plain_fmt)
+        ws.write(row_i, 2, round(leakage, 2), currency_fmt)
+        ws.write(row_i, 3, f"{leakage / total_leakage * 100:.1f}%", plain_fmt)
+
+    ws.write(6, 5, "TOP 5 SUPPLIERS BY LEAKAGE", section_fmt)
+    red_header = header_fmt(COLOURS["dark_red"])
+    ws.write(7, 5, "Supplier", red_header)
+    ws.write(7, 6, "Est. Leakage (£)", red_header)
+    for row_i, (sup, val) in enumerate(summary["top_suppliers"].items(), start=8):
+        ws.write(row_i, 5, sup, plain_fmt)
+        ws.write(row_i, 6, round(val, 2), currency_fmt)
+
+    # --- Flagged Items ---
+    ws = wb.add_worksheet("Flagged Items")
+    df_display = _flagged_display_frame(scored)
+    header_row = list(df_display.columns)
+    currency_cols = {i for i, name in enumerate(header_row) if "(£)" in name}
+
+    red_header = header_fmt(COLOURS["dark_red"])
+    for col_i, h in enumerate(header_row):
+        ws.write(0, col_i, h, red_header)
+    ws.freeze_panes(1, 0)
+    ws.autofilter(0, 0, 0, len(header_row) - 1)
+
+    # One Format per (severity, number-format) triple, shared across all
+    # rows. A date variant is needed because default_date_format only
+    # kicks in when write() is given no format at all — date cells
+    # written through the fill formats would render as raw serials
+    date_cols = {i for i, name in enumerate(header_row) if name == "Date"}
+    sev_fmts = {
+        s: (
+            wb.add_format({"bg_color": colour, "border": 1}),
+            wb.add_format({"bg_color": colour, "border": 1,
+                           "num_format": "#,##0.00"}),
+            wb.add_format({"bg_color": colour, "border": 1,
+                           "num_format": "yyyy-mm-dd"}),
+        )
+        for s, colour in SEVERITY_ROW_COLOURS.items()
+    }
+    default_fmts = (
+        wb.add_format({"bg_color": COLOURS["light_grey"], "border": 1}),
+        wb.add_format({"bg_color": COLOURS["light_grey"], "border": 1,
+                       "num_format": "#,##0.00"}),
+        wb.add_format({"bg_color": COLOURS["light_grey"], "border": 1,
+                       "num_format": "yyyy-mm-dd"}),
+    )
+    if "Severity" in df_display.columns:
+        severities = df_display["Severity"].astype(str).to_numpy()
+    else:
+        severities = np.array([])
+
+    for r_off, row_vals in enumerate(
+        df_display.itertuples(index=False, name=None), start=1
+    ):
+        base_fmt, cur_fmt, date_fmt = sev_fmts.get(
+            severities[r_off - 1] if severities.size else "", default_fmts
+        )
+        for col_i, val in enumerate(row_vals):
+            if col_i in currency_cols:
+                fmt = cur_fmt
+            elif col_i in date_cols:
+                fmt = date_fmt
+            else:
+                fmt = base_fmt
+            ws.write(r_off, col_i, val, fmt)
+
+    # --- Statistics ---
+    ws = wb.add_worksheet("Statistics")
+    ws.write(0, 0, "RULE PERFORMANCE METRICS", section_fmt)
+    green_header = header_fmt(COLOURS["dark_green"])
+    rule_headers = [
+        "Rule", "Total Flags", "Critical", "High", "Medium", "Low",
+        "Total Leakage (£)", "Avg Leakage / Flag (£)", "Max Leakage (£)",
+    ]
+    for col_i, h in enumerate(rule_headers):
+        ws.write(1, col_i, h, green_header)
+    for row_i, row_data in enumerate(rule_rows, start=2):
+        for col_i, val in enumerate(row_data):
+            ws.write(row_i, col_i,
+                     val, currency_fmt if col_i > 5 else plain_fmt)
+
+    ws.write(9, 0, "DAILY LEAKAGE TREND", section_fmt)
+    for col_i, h in enumerate(["Date", "Flags", "Critical", "Total Leakage (£)"]):
+        ws.write(10, col_i, h, navy_header)
+    for row_i, row_vals in enumerate(
+        daily.itertuples(index=False, name=None), start=11
+    ):
+        for col_i, val in enumerate(row_vals):
+            if col_i == 0:
+                fmt = plain_date_fmt
+            elif col_i == 3:
+                fmt = currency_fmt
+            else:
+                fmt = plain_fmt
+            ws.write(row_i, col_i, val, fmt)
+
+    if len(daily) > 1:
+        chart = wb.add_chart({"type": "column"})
+        chart.add_series({
+            "name": "Daily Estimated Leakage (£)",
+            "categories": ["Statistics", 11, 0, 10 + len(daily), 0],
+            "values":     ["Statistics", 11, 3, 10 + len(daily), 3],
+        })
+        chart.set_title({"name": "Daily Estimated Leakage (£)"})
+        chart.set_size({"width": 720, "height": 420})
+        ws.insert_chart(9, 5, chart)
+
+    wb.close()
+
+
 def generate_report(
     scored: pd.DataFrame,
     summary: dict[str, Any],
-    config_path: str = "config.yaml",
+    config_path: str | dict[str, Any] = "config.yaml",
 ) -> Path:
     """Generate the full Excel workbook and write it to the output directory.
 
     Args:
         scored: Scored and classified flagged transactions.
         summary: Executive summary dict from scorer.build_executive_summary().
-        config_path: Path to configuration YAML.
+        config_path: Path to configuration YAML, or an already-parsed
+            config dict.
 
     Returns:
         Path to the generated .xlsx file.
@@ -442,8 +821,7 @@ def generate_report(
     Raises:
         OSError: If output directory cannot be created.
     """
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
+    cfg = resolve_config(config_path)
 
     run_date = datetime.today().strftime("%Y-%m-%d")
     output_dir = Path(cfg["paths"]["output_dir"])
@@ -452,23 +830,49 @@ def generate_report(
     filename = cfg["paths"]["report_filename"].format(date=run_date)
     output_path = output_dir / filename
 
+    # Large flagged tables dominate write time — hand the whole workbook
+    # to the faster xlsxwriter backend when it is installed; small runs
+    # stay on openpyxl, whose startup cost is lower
+    if _HAVE_XLSXWRITER and len(scored) > _XLSXWRITER_ROW_THRESHOLD:
+        _generate_report_xlsxwriter(
+            output_path, scored, summary, run_date,
+            _rule_metrics(scored), _daily_trend(scored),
+        )
+        logger.info(
+            "Excel report saved to %s (xlsxwriter backend, %d rows)",
+            output_path, len(scored),
+        )
+        return output_path
+
     wb = Workbook()
     wb.remove(wb.active)  # Remove default blank sheet
 
-    # Sheet 1: Summary
-    ws_summary = wb.create_sheet("Summary")
-    _build_summary_sheet(ws_summary, summary, run_date)
-    logger.info("Built Summary sheet")
-
-    # Sheet 2: Flagged Items
-    ws_flagged = wb.create_sheet("Flagged Items")
-    _build_flagged_sheet(ws_flagged, scored)
-    logger.info("Built Flagged Items sheet (%d rows)", len(scored))
-
-    # Sheet 3: Statistics
-    ws_stats = wb.create_sheet("Statistics")
-    _build_statistics_sheet(ws_stats, scored)
-    logger.info("Built Statistics sheet")
+    # The statistics aggregations are pandas C code that releases the GIL,
+    # so they run in a background thread while the main thread is stuck in
+    # the GIL-bound openpyxl cell-write loops below
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        rule_rows_future = pool.submit(_rule_metrics, scored)
+        daily_future = pool.submit(_daily_trend, scored)
+
+        # Sheet 1: Summary
+        ws_summary = wb.create_sheet("Summary")
+        _build_summary_sheet(ws_summary, summary, run_date)
+        logger.info("Built Summary sheet")
+
+        # Sheet 2: Flagged Items
+        ws_flagged = wb.create_sheet("Flagged Items")
+        _build_flagged_sheet(ws_flagged, scored)
+        logger.info("Built Flagged Items sheet (%d rows)", len(scored))
+
+        # Sheet 3: Statistics
+        ws_stats = wb.create_sheet("Statistics")
+        _build_statistics_sheet(
+            ws_stats,
+            rule_rows_future.result(),
+            daily_future.result(),
+            include_chart=cfg["reporting"].get("include_chart", True),
+        )
+        logger.info("Built Statistics sheet")
 
     wb.save(output_path)
     logger.info("Excel report saved to %s", output_path)
@@ -18,14 +18,74 @@ import logging
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import yaml
 
+from src.config import resolve_config
+
+# Numba is optional — when present, the financial/composite/severity steps
+# run as one fused compiled loop; otherwise the vectorized pandas/NumPy
+# passes below are used.
+try:
+    from numba import njit
+
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
+
+if _HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _score_kernel(base, amt, low, med, high, crit, hi, md):  # pragma: no cover
+        """Fused scoring loop: financial, composite, and severity codes.
+
+        One pass over the two input arrays instead of four column-wide
+        passes — same arithmetic as the vectorized fallback, including
+        the 2dp rounding and the 100-point composite cap.
+        """
+        n = base.shape[0]
+        fin = np.empty(n)
+        comp = np.empty(n)
+        sev_codes = np.empty(n, np.int8)
+        for i in range(n):
+            a = amt[i]
+            if a <= 0:
+                f = 0.0
+            elif a < low:
+                f = 5 + (a / low) * 5
+            elif a < med:
+                f = 10 + ((a - low) / (med - low)) * 10
+            elif a < high:
+                f = 20 + ((a - med) / (high - med)) * 8
+            else:
+                f = 30.0
+            f = round(f, 2)
+            c = base[i] + f
+            if c > 100.0:
+                c = 100.0
+            fin[i] = f
+            comp[i] = c
+            # Categorical codes: Critical=0, High=1, Medium=2, Low=3
+            if c >= crit:
+                sev_codes[i] = 0
+            elif c >= hi:
+                sev_codes[i] = 1
+            elif c >= md:
+                sev_codes[i] = 2
+            else:
+                sev_codes[i] = 3
+        return fin, comp, sev_codes
+
 # Severity label ordering for sort/comparison
 SEVERITY_ORDER = {"Critical": 4, "High": 3, "Medium": 2, "Low": 1}
 
+# Fixed label order for breakdown dicts — guarantees all four keys exist
+SEVERITY_LABELS = ("Critical", "High", "Medium", "Low")
+
 
 def _financial_impact_score(amount_gbp: float, thresholds: dict[str, int]) -> float:
     """Compute a 0–30 score based on financial leakage magnitude.
@@ -57,6 +117,38 @@ def _financial_impact_score(amount_gbp: float, thresholds: dict[str, int]) -> fl
         return 30.0
 
 
+def _financial_impact_score_vec(
+    amounts: pd.Series,
+    thresholds: dict[str, int],
+) -> np.ndarray:
+    """Vectorized _financial_impact_score over a whole leakage column.
+
+    Same banding and rounding as the scalar helper, but computed as one
+    np.select pass over the ndarray instead of a Python call per row.
+
+    Args:
+        amounts: leakage_amount_gbp column.
+        thresholds: Dict with keys low_threshold, medium_threshold,
+            high_threshold (GBP values from config).
+
+    Returns:
+        float64 array of scores in range [0, 30].
+    """
+    low = thresholds["low_threshold"]
+    med = thresholds["medium_threshold"]
+    high = thresholds["high_threshold"]
+
+    a = amounts.to_numpy(dtype=np.float64, copy=False)
+    conditions = [a <= 0, a < low, a < med, a < high]
+    choices = [
+        0.0,
+        5 + (a / low) * 5,
+        10 + ((a - low) / (med - low)) * 10,
+        20 + ((a - med) / (high - med)) * 8,
+    ]
+    return np.round(np.select(conditions, choices, default=30.0), 2)
+
+
 def _classify_severity(score: float, bands: dict[str, int]) -> str:
     """Map a composite score to a severity label.
 
@@ -79,7 +171,7 @@ def _classify_severity(score: float, bands: dict[str, int]) -> str:
 
 def score_flagged_transactions(
     flagged: pd.DataFrame,
-    config_path: str = "config.yaml",
+    config_path: str | dict[str, Any] = "config.yaml",
 ) -> pd.DataFrame:
     """Apply severity scoring to all flagged transactions.
 
@@ -97,7 +189,8 @@ def score_flagged_transactions(
 
     Args:
         flagged: Output DataFrame from detector.run_detection().
-        config_path: Path to configuration YAML.
+        config_path: Path to configuration YAML, or an already-parsed
+            config dict.
 
     Returns:
         Scored and classified DataFrame.
@@ -110,8 +203,7 @@ def score_flagged_transactions(
     if missing:
         raise ValueError(f"Flagged DataFrame missing columns: {missing}")
 
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
+    cfg = resolve_config(config_path)
 
     scoring_cfg = cfg["scoring"]
     base_scores = scoring_cfg["rule_base_scores"]
@@ -120,21 +212,61 @@ def score_flagged_transactions(
 
     logger.info("Scoring %d flagged transactions", len(flagged))
 
-    df = flagged.copy()
-
-    df["base_score"] = df["rule_triggered"].map(base_scores).fillna(30.0)
-
-    df["financial_score"] = df["leakage_amount_gbp"].apply(
-        lambda x: _financial_impact_score(x, fin_thresholds)
+    # All six columns are computed as locals and attached in one assign —
+    # a single new frame sharing the input's column blocks, instead of a
+    # full copy followed by six setitem passes
+    # dict.get with the default folds the old .map + .fillna pair into a
+    # single scan — no intermediate NaN-bearing Series to re-fill
+    get_base = base_scores.get
+    base_score = np.fromiter(
+        (get_base(rule, 30.0) for rule in flagged["rule_triggered"].to_numpy()),
+        dtype=np.float64,
+        count=len(flagged),
     )
 
-    df["composite_score"] = (df["base_score"] + df["financial_score"]).clip(upper=100)
-
-    df["severity"] = df["composite_score"].apply(
-        lambda s: _classify_severity(s, severity_bands)
-    )
+    if _HAVE_NUMBA:
+        # One fused pass over base + leakage emits all three derived
+        # arrays — a quarter of the memory traffic of the separate steps
+        financial_score, composite_score, sev_codes = _score_kernel(
+            base_score,
+            flagged["leakage_amount_gbp"].to_numpy(dtype=np.float64),
+            float(fin_thresholds["low_threshold"]),
+            float(fin_thresholds["medium_threshold"]),
+            float(fin_thresholds["high_threshold"]),
+            float(severity_bands["critical"]),
+            float(severity_bands["high"]),
+            float(severity_bands["medium"]),
+        )
+        severity = pd.Categorical.from_codes(
+            sev_codes, categories=["Critical", "High", "Medium", "Low"]
+        )
+    else:
+        financial_score = _financial_impact_score_vec(
+            flagged["leakage_amount_gbp"], fin_thresholds
+        )
+        composite_score = np.minimum(base_score + financial_score, 100.0)
+
+        # Vectorized band classification — one np.select pass instead of a
+        # per-row _classify_severity call; Categorical keeps the column as
+        # 4 interned labels rather than N Python strings
+        scores = composite_score
+        severity = pd.Categorical(
+            np.select(
+                [
+                    scores >= severity_bands["critical"],
+                    scores >= severity_bands["high"],
+                    scores >= severity_bands["medium"],
+                ],
+                ["Critical", "High", "Medium"],
+                default="Low",
+            ),
+            categories=["Critical", "High", "Medium", "Low"],
+        )
 
-    df["severity_rank"] = df["severity"].map(SEVERITY_ORDER)
+    # Rank straight off the categorical codes (Critical=0 … Low=3 → 4 … 1)
+    # — no label hashing, and the plain int64 keeps sort_values ordering
+    # by value rather than category position
+    severity_rank = (4 - severity.codes).astype("int64")
 
     action_map = {
         "Critical": "IMMEDIATE: Escalate to Finance Director. Freeze supplier payments pending review.",
@@ -142,13 +274,46 @@ def score_flagged_transactions(
         "Medium":   "THIS WEEK: Add to weekly ops review. Request supplier clarification.",
         "Low":      "MONITOR: Log for trend analysis. Review at end of month.",
     }
-    df["action_required"] = df["severity"].map(action_map)
+    action_required = pd.Series(severity, index=flagged.index).map(action_map)
+
+    df = flagged.assign(
+        base_score=base_score,
+        financial_score=financial_score,
+        composite_score=composite_score,
+        severity=severity,
+        severity_rank=severity_rank,
+        action_required=action_required,
+    )
 
-    # Sort: Critical first, then by leakage descending
-    df = df.sort_values(
-        ["severity_rank", "leakage_amount_gbp"],
-        ascending=[False, False],
-    ).reset_index(drop=True)
+    # Low-cardinality string keys → categorical once here, so every
+    # downstream groupby (summary, statistics sheet, dashboard) buckets
+    # on integer codes instead of re-hashing the same few strings
+    for col in ("rule_triggered", "category", "region"):
+        if col in df.columns and not isinstance(
+            df[col].dtype, pd.CategoricalDtype
+        ):
+            df[col] = df[col].astype("category")
+
+    # Sort: Critical first, then by leakage descending. Both keys are packed
+    # into one int64 — rank in the high bits, pence-quantized leakage in the
+    # low 40 (ample headroom: ±£5.5bn) — so a single stable argsort replaces
+    # the two passes of a multi-column sort_values
+    leak_q = np.round(
+        df["leakage_amount_gbp"].to_numpy(dtype=np.float64) * 100
+    ).astype(np.int64)
+    if np.abs(leak_q).max(initial=0) < (1 << 39):
+        # Bias keeps the low field positive and monotone-decreasing in
+        # leakage even for negative amounts, with no wrap into the rank bits
+        key = ((-severity_rank) << np.int64(40)) | ((np.int64(1) << 39) - leak_q)
+        order = np.argsort(key, kind="stable")
+        df = df.iloc[order].reset_index(drop=True)
+    else:
+        # Leakage outside the packed-key bit budget — keep the exact
+        # two-key sort rather than risk truncation
+        df = df.sort_values(
+            ["severity_rank", "leakage_amount_gbp"],
+            ascending=[False, False],
+        ).reset_index(drop=True)
 
     severity_counts = df["severity"].value_counts().to_dict()
     logger.info(
@@ -164,7 +329,7 @@ def score_flagged_transactions(
 def build_executive_summary(
     scored: pd.DataFrame,
     raw_summary: dict[str, Any],
-    config_path: str = "config.yaml",
+    config_path: str | dict[str, Any] = "config.yaml",
 ) -> dict[str, Any]:
     """Build an executive-level summary dict for reporting and alerting.
 
@@ -175,27 +340,38 @@ def build_executive_summary(
     Args:
         scored: Output of score_flagged_transactions().
         raw_summary: Summary dict from detector.run_detection().
-        config_path: Path to configuration YAML.
+        config_path: Path to configuration YAML, or an already-parsed
+            config dict.
 
     Returns:
         Dict with keys:
             headline_gbp, headline_transactions, severity_breakdown,
             by_category, by_rule, top_suppliers, date_range
     """
-    with open(config_path, "r") as fh:
-        cfg = yaml.safe_load(fh)
+    cfg = resolve_config(config_path)
 
     currency = cfg["project"]["currency"]
 
-    critical_count = int((scored["severity"] == "Critical").sum())
-    high_count = int((scored["severity"] == "High").sum())
-    medium_count = int((scored["severity"] == "Medium").sum())
-    low_count = int((scored["severity"] == "Low").sum())
+    # One vectorized pass over the severity column; reindex pins the label
+    # order and guarantees every severity key is present (no .get fallbacks
+    # needed downstream)
+    severity_breakdown = {
+        label: int(count)
+        for label, count in scored["severity"]
+        .value_counts()
+        .reindex(SEVERITY_LABELS, fill_value=0)
+        .items()
+    }
+    critical_count = severity_breakdown["Critical"]
+    high_count = severity_breakdown["High"]
 
     total_leakage = round(scored["leakage_amount_gbp"].sum(), 2)
 
+    # sort=False skips the implicit key sort (order comes from the explicit
+    # value sorts below); observed=True keeps categorical keys from
+    # expanding to unused category combinations
     by_category = (
-        scored.groupby("category")["leakage_amount_gbp"]
+        scored.groupby("category", sort=False, observed=True)["leakage_amount_gbp"]
         .sum()
         .round(2)
         .sort_values(ascending=False)
@@ -203,7 +379,7 @@ def build_executive_summary(
     )
 
     by_rule = (
-        scored.groupby("rule_triggered")
+        scored.groupby("rule_triggered", sort=False, observed=True)
         .agg(
             count=("transaction_id", "count"),
             leakage_gbp=("leakage_amount_gbp", "sum"),
@@ -212,25 +388,26 @@ def build_executive_summary(
         .to_dict(orient="index")
     )
 
+    # nlargest(5) tracks a 5-element heap instead of sorting every supplier
     top_suppliers = (
-        scored.groupby("supplier_name")["leakage_amount_gbp"]
+        scored.groupby("supplier_name", sort=False, observed=True)[
+            "leakage_amount_gbp"
+        ]
         .sum()
         .round(2)
-        .sort_values(ascending=False)
-        .head(5)
+        .nlargest(5)
         .to_dict()
     )
 
     summary = {
         "headline_gbp": total_leakage,
-        "headline_transactions": int(scored["transaction_id"].nunique()),
+        # pd.unique on the raw ndarray — IDs are never null here, so
+        # nunique's NaN bookkeeping is pure overhead
+        "headline_transactions": int(
+            len(pd.unique(scored["transaction_id"].to_numpy()))
+        ),
         "total_flags": len(scored),
-        "severity_breakdown": {
-            "Critical": critical_count,
-            "High": high_count,
-            "Medium": medium_count,
-            "Low": low_count,
-        },
+        "severity_breakdown": severity_breakdown,
         "by_category": by_category,
         "by_rule": by_rule,
         "top_suppliers": top_suppliers,
@@ -0,0 +1,22 @@
+"""conftest.py — Shared pytest configuration for the test suite."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import _load_config_file
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _clear_config_cache():
+    """Drop the memoized config parse after the session.
+
+    Every test that passes config_path="config.yaml" hits the lru_cache
+    in src.config after the first parse; clearing on teardown keeps the
+    cache from leaking state into anything that imports the package
+    after the suite (e.g. a REPL running pytest.main)."""
+    yield
+    _load_config_file.cache_clear()
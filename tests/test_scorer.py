@@ -38,19 +38,18 @@ class TestFinancialImpactScore:
         "high_threshold": 10000,
     }
 
-    def test_zero_amount_returns_zero(self):
-        assert _financial_impact_score(0.0, self.THRESHOLDS) == 0.0
-
-    def test_negative_amount_returns_zero(self):
-        assert _financial_impact_score(-100.0, self.THRESHOLDS) == 0.0
-
-    def test_below_low_threshold_returns_low_score(self):
-        score = _financial_impact_score(100.0, self.THRESHOLDS)
-        assert 5.0 <= score < 10.0
-
-    def test_above_high_threshold_returns_max(self):
-        score = _financial_impact_score(50000.0, self.THRESHOLDS)
-        assert score == 30.0
+    @pytest.mark.parametrize(
+        "amount,lo,hi",
+        [
+            (0.0,      0.0,  0.0),   # zero amount
+            (-100.0,   0.0,  0.0),   # negative amount
+            (100.0,    5.0,  10.0),  # below low threshold
+            (50000.0, 30.0, 30.0),   # above high threshold caps at max
+        ],
+    )
+    def test_boundary_amounts(self, amount, lo, hi):
+        score = _financial_impact_score(amount, self.THRESHOLDS)
+        assert lo <= score <= hi
 
     def test_score_increases_with_amount(self):
         """Score should be monotonically non-decreasing with amount."""
@@ -72,29 +71,21 @@ class TestClassifySeverity:
 
     BANDS = {"critical": 80, "high": 60, "medium": 35, "low": 0}
 
-    def test_score_above_critical_threshold(self):
-        assert _classify_severity(85.0, self.BANDS) == "Critical"
-
-    def test_score_at_critical_threshold(self):
-        assert _classify_severity(80.0, self.BANDS) == "Critical"
-
-    def test_score_in_high_band(self):
-        assert _classify_severity(70.0, self.BANDS) == "High"
-
-    def test_score_at_high_threshold(self):
-        assert _classify_severity(60.0, self.BANDS) == "High"
-
-    def test_score_in_medium_band(self):
-        assert _classify_severity(50.0, self.BANDS) == "Medium"
-
-    def test_score_at_medium_threshold(self):
-        assert _classify_severity(35.0, self.BANDS) == "Medium"
-
-    def test_score_in_low_band(self):
-        assert _classify_severity(20.0, self.BANDS) == "Low"
-
-    def test_score_zero(self):
-        assert _classify_severity(0.0, self.BANDS) == "Low"
+    @pytest.mark.parametrize(
+        "score,expected",
+        [
+            (85.0, "Critical"),  # above critical threshold
+            (80.0, "Critical"),  # at critical threshold
+            (70.0, "High"),      # in high band
+            (60.0, "High"),      # at high threshold
+            (50.0, "Medium"),    # in medium band
+            (35.0, "Medium"),    # at medium threshold
+            (20.0, "Low"),       # in low band
+            (0.0,  "Low"),       # score zero
+        ],
+    )
+    def test_band_boundaries(self, score, expected):
+        assert _classify_severity(score, self.BANDS) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -149,70 +140,83 @@ def _make_flagged_df() -> pd.DataFrame:
     ])
 
 
+# Scoring is pure, so one pipeline run serves every read-only test below —
+# session scope means config parsing, classification, and the final sort
+# happen once instead of once per test
+@pytest.fixture(scope="session")
+def flagged_df() -> pd.DataFrame:
+    return _make_flagged_df()
+
+
+@pytest.fixture(scope="session")
+def scored_df(flagged_df) -> pd.DataFrame:
+    return score_flagged_transactions(flagged_df.copy(), config_path="config.yaml")
+
+
 class TestScoreFlaggedTransactions:
     """Tests for the full score_flagged_transactions function."""
 
-    def test_required_output_columns_present(self):
+    def test_required_output_columns_present(self, scored_df):
         """Output must contain all severity scoring columns."""
-        df = _make_flagged_df()
-        scored = score_flagged_transactions(df, config_path="config.yaml")
         for col in ["base_score", "financial_score", "composite_score",
                     "severity", "severity_rank", "action_required"]:
-            assert col in scored.columns, f"Missing column: {col}"
+            assert col in scored_df.columns, f"Missing column: {col}"
 
-    def test_severity_values_valid(self):
+    def test_severity_values_valid(self, scored_df):
         """All severity values must be one of the four expected labels."""
-        df = _make_flagged_df()
-        scored = score_flagged_transactions(df, config_path="config.yaml")
         valid = {"Critical", "High", "Medium", "Low"}
-        assert set(scored["severity"].unique()).issubset(valid)
+        assert scored_df["severity"].isin(valid).all()
 
-    def test_composite_score_within_bounds(self):
+    def test_composite_score_within_bounds(self, scored_df):
         """Composite score must be in [0, 100]."""
-        df = _make_flagged_df()
-        scored = score_flagged_transactions(df, config_path="config.yaml")
-        assert (scored["composite_score"] >= 0).all()
-        assert (scored["composite_score"] <= 100).all()
+        assert (scored_df["composite_score"] >= 0).all()
+        assert (scored_df["composite_score"] <= 100).all()
 
-    def test_sorted_by_severity_rank_desc(self):
+    def test_sorted_by_severity_rank_desc(self, scored_df):
         """Output should be sorted with highest severity first."""
-        df = _make_flagged_df()
-        scored = score_flagged_transactions(df, config_path="config.yaml")
-        ranks = scored["severity_rank"].tolist()
+        ranks = scored_df["severity_rank"].tolist()
         assert ranks == sorted(ranks, reverse=True)
 
-    def test_missing_required_column_raises(self):
+    def test_missing_required_column_raises(self, flagged_df):
         """Passing a DataFrame without rule_triggered should raise ValueError."""
-        df = _make_flagged_df().drop(columns=["rule_triggered"])
+        df = flagged_df.drop(columns=["rule_triggered"])
         with pytest.raises(ValueError, match="rule_triggered"):
             score_flagged_transactions(df, config_path="config.yaml")
 
-    def test_row_count_unchanged(self):
+    def test_row_count_unchanged(self, flagged_df, scored_df):
         """Scoring should not add or remove rows."""
-        df = _make_flagged_df()
-        scored = score_flagged_transactions(df, config_path="config.yaml")
-        assert len(scored) == len(df)
+        assert len(scored_df) == len(flagged_df)
 
 
 # ---------------------------------------------------------------------------
 # Executive summary
 # ---------------------------------------------------------------------------
 
+# All three summary tests only read from the output, so the raw summary
+# and the build itself are shared at module scope — one invocation
+# instead of three
+@pytest.fixture(scope="module")
+def raw_summary(scored_df) -> dict:
+    return {
+        "total_transactions": 1000,
+        "total_leakage_gbp": round(scored_df["leakage_amount_gbp"].sum(), 2),
+        "date_range_start": "2024-01-01",
+        "date_range_end": "2024-03-31",
+        "by_rule": {},
+    }
+
+
+@pytest.fixture(scope="module")
+def exec_summary(scored_df, raw_summary) -> dict:
+    return build_executive_summary(scored_df, raw_summary, config_path="config.yaml")
+
+
 class TestBuildExecutiveSummary:
     """Tests for build_executive_summary output structure."""
 
-    def test_required_keys_present(self):
+    def test_required_keys_present(self, exec_summary):
         """Executive summary dict must contain all required top-level keys."""
-        df = _make_flagged_df()
-        scored = score_flagged_transactions(df, config_path="config.yaml")
-        raw_summary = {
-            "total_transactions": 1000,
-            "total_leakage_gbp": scored["leakage_amount_gbp"].sum(),
-            "date_range_start": "2024-01-01",
-            "date_range_end": "2024-03-31",
-            "by_rule": {},
-        }
-        summary = build_executive_summary(scored, raw_summary, config_path="config.yaml")
+        summary = exec_summary
         for key in [
             "headline_gbp", "headline_transactions", "total_flags",
             "severity_breakdown", "by_category", "by_rule",
@@ -220,32 +224,12 @@ class TestBuildExecutiveSummary:
         ]:
             assert key in summary, f"Missing key in executive summary: {key}"
 
-    def test_severity_breakdown_keys(self):
+    def test_severity_breakdown_keys(self, exec_summary):
         """severity_breakdown must contain all four severity labels."""
-        df = _make_flagged_df()
-        scored = score_flagged_transactions(df, config_path="config.yaml")
-        raw_summary = {
-            "total_transactions": 1000,
-            "total_leakage_gbp": scored["leakage_amount_gbp"].sum(),
-            "date_range_start": "2024-01-01",
-            "date_range_end": "2024-03-31",
-            "by_rule": {},
-        }
-        summary = build_executive_summary(scored, raw_summary, config_path="config.yaml")
         for sev in ["Critical", "High", "Medium", "Low"]:
-            assert sev in summary["severity_breakdown"]
+            assert sev in exec_summary["severity_breakdown"]
 
-    def test_headline_gbp_matches_scored_total(self):
+    def test_headline_gbp_matches_scored_total(self, scored_df, exec_summary):
         """headline_gbp should equal the sum of leakage_amount_gbp in scored df."""
-        df = _make_flagged_df()
-        scored = score_flagged_transactions(df, config_path="config.yaml")
-        expected_total = round(scored["leakage_amount_gbp"].sum(), 2)
-        raw_summary = {
-            "total_transactions": 1000,
-            "total_leakage_gbp": expected_total,
-            "date_range_start": "2024-01-01",
-            "date_range_end": "2024-03-31",
-            "by_rule": {},
-        }
-        summary = build_executive_summary(scored, raw_summary, config_path="config.yaml")
-        assert abs(summary["headline_gbp"] - expected_total) < 0.01
+        expected_total = round(scored_df["leakage_amount_gbp"].sum(), 2)
+        assert abs(exec_summary["headline_gbp"] - expected_total) < 0.01